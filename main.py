@@ -1,19 +1,8 @@
-"""Main module for JIRA automation system."""
+"""Main module for JIRA automation system.
 
-from src.lambda_handlers import (
-    health_check_handler,
-    jira_webhook_handler,
-    manual_sync_handler,
-    scheduled_sync_handler,
-)
-
-# Export Lambda handlers for AWS
-__all__ = [
-    "jira_webhook_handler",
-    "scheduled_sync_handler",
-    "manual_sync_handler",
-    "health_check_handler",
-]
+Lambda functions point directly at the handlers in ``src.lambda_handlers`` so
+each cold start only imports what its entry point needs.
+"""
 
 
 def main() -> None:
@@ -1,12 +1,70 @@
 #!/usr/bin/env python3
 """Script to check sync status and troubleshoot issues."""
 
+import io
+import multiprocessing
 import os
 import sys
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from decimal import Decimal
 from typing import Any
 
 import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
+
+# Maximum number of keys DynamoDB accepts in a single BatchGetItem request
+BATCH_GET_LIMIT = 100
+
+# Attributes read by print_sync_summary / print_detailed_record
+RECORD_ATTRIBUTES = (
+    "sync_id",
+    "jira_1_key",
+    "jira_2_key",
+    "status",
+    "last_sync_timestamp",
+    "last_sync_direction",
+    "error_count",
+    "last_error",
+    "requires_manual_resolution",
+    "conflict_details",
+)
+
+
+RECORD_TEMPLATE = (
+    "🔍 Sync Record: {sync_id}\n"
+    + "-" * 50
+    + "\n"
+    + "JIRA 1 Key: {jira_1_key}\n"
+    + "JIRA 2 Key: {jira_2_key}\n"
+    + "Status: {status}\n"
+    + "Last Sync: {last_sync_timestamp}\n"
+    + "Direction: {last_sync_direction}\n"
+    + "Error Count: {error_count}\n"
+)
+
+# Placeholder shown by RECORD_TEMPLATE for attributes missing from an item
+RECORD_DEFAULTS = {"sync_id": "unknown", "status": "unknown", "error_count": 0}
+
+
+class RecordView(dict):
+    """Mapping over a sync record item that fills in display defaults for missing keys."""
+
+    def __missing__(self, key: str) -> Any:
+        """Return the display default for a missing attribute."""
+        return RECORD_DEFAULTS.get(key, "N/A")
+
+
+def _projection_kwargs(attributes: tuple[str, ...]) -> dict[str, Any]:
+    """Build ProjectionExpression kwargs, aliasing names to avoid DynamoDB reserved words."""
+    names = {f"#a{i}": attr for i, attr in enumerate(attributes)}
+    return {
+        "ProjectionExpression": ", ".join(names),
+        "ExpressionAttributeNames": names,
+    }
 
 
 def get_dynamodb_table(table_name: str, region: str = "us-east-1"):
@@ -15,53 +73,193 @@ def get_dynamodb_table(table_name: str, region: str = "us-east-1"):
     return dynamodb.Table(table_name)
 
 
-def get_all_sync_records(table) -> list[dict[str, Any]]:
-    """Get all sync records from DynamoDB."""
-    response = table.scan()
-    items = response["Items"]
+def get_all_sync_records(
+    table,
+    attributes: tuple[str, ...] | None = RECORD_ATTRIBUTES,
+) -> Iterator[dict[str, Any]]:
+    """Stream all sync records from DynamoDB, projecting server-side."""
+    scan_kwargs: dict[str, Any] = {"TableName": table.name, "PaginationConfig": {"PageSize": 1000}}
+    if attributes:
+        scan_kwargs.update(_projection_kwargs(attributes))
+
+    # The resource's client deserializes items and accepts condition objects
+    paginator = table.meta.client.get_paginator("scan")
+    for page in paginator.paginate(**scan_kwargs):
+        yield from page["Items"]
+
+
+def _scan_segment(
+    table_name: str,
+    region: str,
+    segment: int,
+    total_segments: int,
+    attributes: tuple[str, ...] | None,
+) -> list[dict[str, Any]]:
+    """Scan a single segment of the table using a thread-local boto3 session."""
+    # boto3 resources are not thread-safe, so each worker builds its own
+    table = boto3.session.Session().resource("dynamodb", region_name=region).Table(table_name)
+
+    scan_kwargs: dict[str, Any] = {
+        "TableName": table_name,
+        "Segment": segment,
+        "TotalSegments": total_segments,
+        "PaginationConfig": {"PageSize": 1000},
+    }
+    if attributes:
+        scan_kwargs.update(_projection_kwargs(attributes))
+
+    items: list[dict[str, Any]] = []
+    for page in table.meta.client.get_paginator("scan").paginate(**scan_kwargs):
+        items.extend(page["Items"])
 
-    # Handle pagination
-    while "LastEvaluatedKey" in response:
-        response = table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-        items.extend(response["Items"])
+    return items
+
+
+def get_all_sync_records_parallel(
+    table,
+    total_segments: int = 8,
+    attributes: tuple[str, ...] | None = RECORD_ATTRIBUTES,
+) -> list[dict[str, Any]]:
+    """Get all sync records using a parallel segmented scan."""
+    region = table.meta.client.meta.region_name
+
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        futures = [
+            executor.submit(_scan_segment, table.name, region, segment, total_segments, attributes)
+            for segment in range(total_segments)
+        ]
+        items: list[dict[str, Any]] = []
+        for future in futures:
+            items.extend(future.result())
 
     return items
 
 
+def scan_sync_records(table, total_segments: int) -> Iterable[dict[str, Any]]:
+    """Scan all sync records, streaming sequentially or fanning out across segments."""
+    if total_segments <= 1:
+        return get_all_sync_records(table)
+    return get_all_sync_records_parallel(table, total_segments)
+
+
 def get_sync_record_by_id(table, sync_id: str) -> dict[str, Any] | None:
     """Get specific sync record by ID."""
     response = table.get_item(Key={"sync_id": sync_id})
     return response.get("Item")
 
 
-def get_records_by_status(table, status: str) -> list[dict[str, Any]]:
-    """Get records with specific status."""
-    response = table.query(
+def get_sync_records_by_ids(table, sync_ids: list[str]) -> list[dict[str, Any]]:
+    """Get multiple sync records by ID using BatchGetItem (100 keys per request)."""
+    items: list[dict[str, Any]] = []
+
+    for start in range(0, len(sync_ids), BATCH_GET_LIMIT):
+        chunk = sync_ids[start : start + BATCH_GET_LIMIT]
+        request_items = {table.name: {"Keys": [{"sync_id": sync_id} for sync_id in chunk]}}
+
+        # Re-drive keys DynamoDB left unprocessed (e.g. due to throttling)
+        attempt = 0
+        while request_items:
+            if attempt:
+                time.sleep(min(2**attempt * 0.05, 2))
+            response = table.meta.client.batch_get_item(RequestItems=request_items)
+            items.extend(response["Responses"].get(table.name, []))
+            request_items = response.get("UnprocessedKeys") or {}
+            attempt += 1
+
+    return items
+
+
+def _query_all(table, **query_kwargs: Any) -> list[dict[str, Any]]:
+    """Run a query and follow its pagination."""
+    response = table.query(**query_kwargs)
+    items = response["Items"]
+
+    while "LastEvaluatedKey" in response:
+        response = table.query(**query_kwargs, ExclusiveStartKey=response["LastEvaluatedKey"])
+        items.extend(response["Items"])
+
+    return items
+
+
+def get_records_by_status(
+    table,
+    status: str,
+    attributes: tuple[str, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """Get records with specific status, optionally returning only the given attributes."""
+    query_kwargs: dict[str, Any] = {}
+    if attributes:
+        query_kwargs.update(_projection_kwargs(attributes), Select="SPECIFIC_ATTRIBUTES")
+
+    return _query_all(
+        table,
         IndexName="status-index",
         KeyConditionExpression=Key("status").eq(status),
+        **query_kwargs,
     )
-    return response["Items"]
 
 
-def print_sync_summary(records: list[dict[str, Any]]) -> None:
-    """Print summary of sync records."""
-    status_counts = {}
+def get_unindexed_conflict_records(table) -> list[dict[str, Any]]:
+    """Get conflicted records saved before the conflicts index existed (they lack needs_resolution).
+
+    Any save since then sets the attribute, so such records still have the conflict status they were
+    flagged with and are found through the status index.
+    """
+    return _query_all(
+        table,
+        IndexName="status-index",
+        KeyConditionExpression=Key("status").eq("conflict"),
+        FilterExpression=Attr("requires_manual_resolution").eq(True) & Attr("needs_resolution").not_exists(),
+    )
+
+
+def get_records_requiring_resolution(table) -> list[dict[str, Any]]:
+    """Get records flagged for manual resolution via the sparse conflicts index, plus unindexed ones."""
+    items = _query_all(table, IndexName="conflicts-index", KeyConditionExpression=Key("needs_resolution").eq(1))
+    items.extend(get_unindexed_conflict_records(table))
+    return items
+
+
+def backfill_conflicts_index(table) -> int:
+    """Set needs_resolution on unindexed conflicted records so they enter the conflicts index."""
+    conditional_check_failed = table.meta.client.exceptions.ConditionalCheckFailedException
+    count = 0
+    for record in get_unindexed_conflict_records(table):
+        try:
+            table.update_item(
+                Key={"sync_id": record["sync_id"]},
+                UpdateExpression="SET needs_resolution = :one",
+                ConditionExpression=Attr("requires_manual_resolution").eq(True),
+                ExpressionAttributeValues={":one": 1},
+            )
+            count += 1
+        except conditional_check_failed:
+            # Resolved since it was read
+            continue
+    return count
+
+
+def print_sync_summary(records: Iterable[dict[str, Any]]) -> None:
+    """Print summary of sync records, consuming them in a single pass."""
     conflict_count = 0
     error_count = 0
 
-    for record in records:
-        status = record.get("status", "unknown")
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-        if record.get("requires_manual_resolution", False):
-            conflict_count += 1
+    def _statuses() -> Iterator[str]:
+        nonlocal conflict_count, error_count
+        for record in records:
+            # Projected items omit absent attributes, so bound dict.get is used over itemgetter
+            get = record.get
+            conflict_count += bool(get("requires_manual_resolution"))
+            error_count += get("error_count", 0) > 0
+            yield get("status", "unknown")
 
-        if record.get("error_count", 0) > 0:
-            error_count += 1
+    # Counter consumes the status column in its C counting loop
+    status_counts = Counter(_statuses())
+    total_count = status_counts.total()
 
     print("📊 Sync Status Summary")  # noqa: T201
     print("=" * 40)  # noqa: T201
-    print(f"Total records: {len(records)}")  # noqa: T201
+    print(f"Total records: {total_count}")  # noqa: T201
     print(f"Records with conflicts: {conflict_count}")  # noqa: T201
     print(f"Records with errors: {error_count}")  # noqa: T201
     print()  # noqa: T201
@@ -72,32 +270,67 @@ def print_sync_summary(records: list[dict[str, Any]]) -> None:
     print()  # noqa: T201
 
 
-def print_detailed_record(record: dict[str, Any]) -> None:
-    """Print detailed information about a sync record."""
-    print(f"🔍 Sync Record: {record.get('sync_id', 'unknown')}")  # noqa: T201
-    print("-" * 50)  # noqa: T201
-    print(f"JIRA 1 Key: {record.get('jira_1_key', 'N/A')}")  # noqa: T201
-    print(f"JIRA 2 Key: {record.get('jira_2_key', 'N/A')}")  # noqa: T201
-    print(f"Status: {record.get('status', 'unknown')}")  # noqa: T201
-    print(f"Last Sync: {record.get('last_sync_timestamp', 'N/A')}")  # noqa: T201
-    print(f"Direction: {record.get('last_sync_direction', 'N/A')}")  # noqa: T201
-    print(f"Error Count: {record.get('error_count', 0)}")  # noqa: T201
+def _display_timestamp(value: Any) -> Any:
+    """Render a stored epoch-microsecond timestamp as ISO-8601; older items already hold strings."""
+    if isinstance(value, Decimal | int):
+        return datetime.fromtimestamp(int(value) / 1_000_000, tz=UTC).isoformat()
+    return value
+
+
+def format_detailed_record(record: dict[str, Any]) -> str:
+    """Render detailed information about a sync record."""
+    view = RecordView(record)
+    if "last_sync_timestamp" in view:
+        view["last_sync_timestamp"] = _display_timestamp(view["last_sync_timestamp"])
+    rendered = RECORD_TEMPLATE.format_map(view)
 
     if record.get("last_error"):
-        print(f"Last Error: {record['last_error']}")  # noqa: T201
+        rendered += f"Last Error: {record['last_error']}\n"
 
     if record.get("requires_manual_resolution"):
-        print("⚠️  REQUIRES MANUAL RESOLUTION")  # noqa: T201
+        rendered += "⚠️  REQUIRES MANUAL RESOLUTION\n"
         if record.get("conflict_details"):
-            print(f"Conflict Details: {record['conflict_details']}")  # noqa: T201
+            rendered += f"Conflict Details: {record['conflict_details']}\n"
+
+    return rendered + "\n"
+
+
+def print_detailed_record(record: dict[str, Any]) -> None:
+    """Print detailed information about a sync record."""
+    sys.stdout.write(format_detailed_record(record))
+
+
+def print_detailed_records(records: Iterable[dict[str, Any]]) -> None:
+    """Print detailed information for many sync records with a single write."""
+    sys.stdout.write("".join(map(format_detailed_record, records)))
+
+
+def _format_chunk(records: list[dict[str, Any]]) -> str:
+    """Render a chunk of records; runs in a worker process."""
+    return "".join(map(format_detailed_record, records))
 
-    print()  # noqa: T201
+
+def print_detailed_records_parallel(records: list[dict[str, Any]], workers: int, chunk_size: int = 512) -> None:
+    """Render records across a process pool and write the chunks in order."""
+    chunks = [records[start : start + chunk_size] for start in range(0, len(records), chunk_size)]
+    with multiprocessing.Pool(workers) as pool:
+        for rendered in pool.imap(_format_chunk, chunks):
+            sys.stdout.write(rendered)
+
+
+def _render_into(records: Iterable[dict[str, Any]], buffer: io.StringIO) -> Iterator[dict[str, Any]]:
+    """Yield records unchanged while appending their detailed rendering to buffer."""
+    for record in records:
+        buffer.write(format_detailed_record(record))
+        yield record
 
 
 def main() -> None:
     """Run the sync status checker."""
     table_name = os.getenv("DYNAMODB_TABLE_NAME", "jira-sync-state")
     region = os.getenv("AWS_REGION", "us-east-1")
+    scan_segments = int(os.getenv("SCAN_SEGMENTS", "8"))
+    format_workers = int(os.getenv("FORMAT_WORKERS", "1"))
 
     if len(sys.argv) < 2:
         print("Usage: python check-sync-status.py <command> [args]")  # noqa: T201
@@ -106,37 +339,46 @@ def main() -> None:
         print("  summary                    - Show sync status summary")  # noqa: T201
         print("  failed                     - Show failed sync records")  # noqa: T201
         print("  conflicts                  - Show records with conflicts")  # noqa: T201
+        print("  backfill-conflicts         - Add pre-index conflicts to the conflicts index")  # noqa: T201
         print("  record <sync_id>          - Show specific record details")  # noqa: T201
+        print("  records <id1,id2,...>     - Show details for several records")  # noqa: T201
         print("  all                       - Show all records")  # noqa: T201
         print()  # noqa: T201
         print("Environment variables:")  # noqa: T201
         print(f"  DYNAMODB_TABLE_NAME={table_name}")  # noqa: T201
         print(f"  AWS_REGION={region}")  # noqa: T201
+        print(f"  SCAN_SEGMENTS={scan_segments}")  # noqa: T201
+        print(f"  FORMAT_WORKERS={format_workers}")  # noqa: T201
         sys.exit(1)
 
     command = sys.argv[1].lower()
 
+    # Bulk commands print thousands of lines; avoid a flush per newline on TTYs
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+
     try:
         table = get_dynamodb_table(table_name, region)
 
         if command == "summary":
-            records = get_all_sync_records(table)
+            records = scan_sync_records(table, scan_segments)
             print_sync_summary(records)
 
         elif command == "failed":
-            records = get_records_by_status(table, "failed")
+            records = get_records_by_status(table, "failed", RECORD_ATTRIBUTES)
             print(f"Found {len(records)} failed sync records:")  # noqa: T201
             print()  # noqa: T201
-            for record in records:
-                print_detailed_record(record)
+            print_detailed_records(records)
 
         elif command == "conflicts":
-            records = get_all_sync_records(table)
-            conflict_records = [r for r in records if r.get("requires_manual_resolution")]
+            conflict_records = get_records_requiring_resolution(table)
             print(f"Found {len(conflict_records)} records with conflicts:")  # noqa: T201
             print()  # noqa: T201
-            for record in conflict_records:
-                print_detailed_record(record)
+            print_detailed_records(conflict_records)
+
+        elif command == "backfill-conflicts":
+            count = backfill_conflicts_index(table)
+            print(f"✅ Added {count} conflicted records to the conflicts index")  # noqa: T201
 
         elif command == "record":
             if len(sys.argv) < 3:
@@ -150,13 +392,34 @@ def main() -> None:
             else:
                 print(f"❌ Sync record '{sync_id}' not found")  # noqa: T201
 
+        elif command == "records":
+            if len(sys.argv) < 3:
+                print("Error: comma-separated sync_ids required for 'records' command")  # noqa: T201
+                sys.exit(1)
+
+            sync_ids = list(dict.fromkeys(s for s in sys.argv[2].split(",") if s))
+            records = get_sync_records_by_ids(table, sync_ids)
+            found_ids = {record["sync_id"] for record in records}
+            print_detailed_records(records)
+            for sync_id in sync_ids:
+                if sync_id not in found_ids:
+                    print(f"❌ Sync record '{sync_id}' not found")  # noqa: T201
+
         elif command == "all":
-            records = get_all_sync_records(table)
-            print_sync_summary(records)
-            print("All sync records:")  # noqa: T201
-            print()  # noqa: T201
-            for record in records:
-                print_detailed_record(record)
+            if format_workers > 1:
+                # Very large tables: rendering is CPU-bound, so fan it out across processes
+                records = list(scan_sync_records(table, scan_segments))
+                print_sync_summary(records)
+                print("All sync records:")  # noqa: T201
+                print()  # noqa: T201
+                print_detailed_records_parallel(records, format_workers)
+            else:
+                # Single pass: aggregate the summary while rendering each record
+                details = io.StringIO()
+                print_sync_summary(_render_into(scan_sync_records(table, scan_segments), details))
+                print("All sync records:")  # noqa: T201
+                print()  # noqa: T201
+                sys.stdout.write(details.getvalue())
 
         else:
             print(f"❌ Unknown command: {command}")  # noqa: T201
@@ -2,6 +2,7 @@
 """Test script for JIRA status transitions."""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path for imports
@@ -11,19 +12,20 @@ from config import load_config
 from jira_client import JiraClient
 
 
+@lru_cache(maxsize=2)
+def _get_client(jira_instance: int) -> JiraClient:
+    """Get a cached JIRA client for the given instance."""
+    config = load_config()
+    jira_config = config.jira_instance_1 if jira_instance == 1 else config.jira_instance_2
+    return JiraClient(jira_config)
+
+
 def test_transitions(issue_key: str, jira_instance: int = 1) -> None:
     """Test available transitions for an issue."""
     print(f"Testing transitions for issue: {issue_key}")  # noqa: T201
 
     try:
-        config = load_config()
-
-        if jira_instance == 1:
-            jira_config = config.jira_instance_1
-        else:
-            jira_config = config.jira_instance_2
-
-        client = JiraClient(jira_config)
+        client = _get_client(jira_instance)
 
         # Get current issue status
         issue = client.get_issue(issue_key)
@@ -76,14 +78,7 @@ def test_status_mapping(issue_key: str, target_status: str, jira_instance: int =
     print(f"Testing transition to status '{target_status}' for issue: {issue_key}")  # noqa: T201
 
     try:
-        config = load_config()
-
-        if jira_instance == 1:
-            jira_config = config.jira_instance_1
-        else:
-            jira_config = config.jira_instance_2
-
-        client = JiraClient(jira_config)
+        client = _get_client(jira_instance)
 
         # Get current status
         issue = client.get_issue(issue_key)
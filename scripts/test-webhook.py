@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 """Test script for JIRA webhook endpoints."""
 
+import argparse
 import hashlib
 import hmac
 import json
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session so repeated requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
 
 
 def create_test_webhook_payload() -> dict:
     """Create a test JIRA webhook payload."""
+    now = datetime.now(UTC)
+    # JIRA's own timestamp format; isoformat() already carries the offset, so appending "Z" made it invalid
+    timestamp = now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{now.microsecond // 1000:03d}+0000"
     return {
-        "timestamp": int(datetime.now(UTC).timestamp() * 1000),
+        "timestamp": int(now.timestamp() * 1000),
         "webhookEvent": "jira:issue_created",
         "issue_event_type_name": "issue_created",
         "issue": {
@@ -24,8 +33,8 @@ def create_test_webhook_payload() -> dict:
                 "issuetype": {"name": "Task"},
                 "priority": {"name": "Medium"},
                 "status": {"name": "To Do"},
-                "created": datetime.now(UTC).isoformat() + "Z",
-                "updated": datetime.now(UTC).isoformat() + "Z",
+                "created": timestamp,
+                "updated": timestamp,
                 "project": {"key": "TEST"},
                 "reporter": {
                     "emailAddress": "test@example.com",
@@ -40,21 +49,37 @@ def create_test_webhook_payload() -> dict:
     }
 
 
-def sign_payload(payload: str, secret: str) -> str:
-    """Create HMAC signature for webhook payload."""
-    signature = hmac.new(
-        secret.encode("utf-8"),
-        payload.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-    return f"sha256={signature}"
+def sign_payload_bytes(payload: bytes, secret: bytes) -> bytes:
+    """Create the raw HMAC-SHA256 digest for a webhook payload."""
+    return hmac.digest(secret, payload, hashlib.sha256)
+
+
+def sign_payload_header(digest: bytes) -> str:
+    """Format a raw digest as the X-Hub-Signature-256 header value."""
+    return f"sha256={digest.hex()}"
+
 
+def verify_payload_digest(payload: bytes, secret: bytes, digest: bytes) -> bool:
+    """Check a raw digest against the payload in constant time."""
+    return hmac.compare_digest(sign_payload_bytes(payload, secret), digest)
 
-def test_webhook(webhook_url: str, secret: str) -> None:
+
+def send_webhook(webhook_url: str, payload: bytes, headers: dict[str, str]) -> requests.Response:
+    """POST a signed payload to the webhook endpoint over the shared session."""
+    return SESSION.post(
+        webhook_url,
+        data=payload,
+        headers=headers,
+        timeout=30,
+    )
+
+
+def test_webhook(webhook_url: str, secret: str, repeat: int = 1, concurrency: int = 1) -> None:
     """Test webhook endpoint with a sample payload."""
     payload_dict = create_test_webhook_payload()
-    payload_str = json.dumps(payload_dict)
-    signature = sign_payload(payload_str, secret)
+    # Serialized and encoded once; the same bytes are signed and sent on every request
+    payload_bytes = json.dumps(payload_dict, separators=(",", ":")).encode()
+    signature = sign_payload_header(sign_payload_bytes(payload_bytes, secret.encode("utf-8")))
 
     headers = {
         "Content-Type": "application/json",
@@ -62,16 +87,15 @@ def test_webhook(webhook_url: str, secret: str) -> None:
     }
 
     print(f"Testing webhook: {webhook_url}")  # noqa: T201
-    print(f"Payload: {payload_str}")  # noqa: T201
+    print(f"Payload: {payload_bytes.decode()}")  # noqa: T201
     print(f"Signature: {signature}")  # noqa: T201
 
+    if repeat > 1:
+        run_load_test(webhook_url, payload_bytes, headers, repeat, concurrency)
+        return
+
     try:
-        response = requests.post(
-            webhook_url,
-            data=payload_str,
-            headers=headers,
-            timeout=30,
-        )
+        response = send_webhook(webhook_url, payload_bytes, headers)
 
         print(f"Response status: {response.status_code}")  # noqa: T201
         print(f"Response body: {response.text}")  # noqa: T201
@@ -85,17 +109,42 @@ def test_webhook(webhook_url: str, secret: str) -> None:
         print(f"❌ Request failed: {e}")  # noqa: T201
 
 
-def main() -> None:
-    """Test webhook endpoint with sample payload."""
-    if len(sys.argv) != 3:
-        print("Usage: python test-webhook.py <webhook_url> <webhook_secret>")  # noqa: T201
-        print("Example: python test-webhook.py https://api.example.com/webhook/jira1 mysecret")  # noqa: T201
-        sys.exit(1)
+def run_load_test(
+    webhook_url: str,
+    payload: bytes,
+    headers: dict[str, str],
+    repeat: int,
+    concurrency: int,
+) -> None:
+    """Send the same payload repeatedly and report status code counts."""
+
+    def _send(_: int) -> str:
+        try:
+            return str(send_webhook(webhook_url, payload, headers).status_code)
+        except requests.exceptions.RequestException as e:
+            return type(e).__name__
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(_send, range(repeat)))
 
-    webhook_url = sys.argv[1]
-    webhook_secret = sys.argv[2]
+    print(f"Sent {repeat} requests with concurrency {concurrency}")  # noqa: T201
+    for outcome in sorted(set(outcomes)):
+        print(f"  {outcome}: {outcomes.count(outcome)}")  # noqa: T201
 
-    test_webhook(webhook_url, webhook_secret)
+
+def main() -> None:
+    """Test webhook endpoint with sample payload."""
+    parser = argparse.ArgumentParser(
+        description="Send a signed sample payload to a JIRA webhook endpoint.",
+        epilog="Example: python test-webhook.py https://api.example.com/webhook/jira1 mysecret",
+    )
+    parser.add_argument("webhook_url")
+    parser.add_argument("webhook_secret")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of requests to send")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of concurrent senders")
+    args = parser.parse_args()
+
+    test_webhook(args.webhook_url, args.webhook_secret, args.repeat, args.concurrency)
 
 
 if __name__ == "__main__":
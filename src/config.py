@@ -1,35 +1,49 @@
 """Configuration management for JIRA sync system."""
 
-from decouple import config
-from pydantic import BaseModel, Field
+import os
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JiraConfig(BaseModel):
     """Configuration for a JIRA instance."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     base_url: str = Field(..., description="JIRA instance base URL")
     username: str = Field(..., description="JIRA username")
     api_token: str = Field(..., description="JIRA API token")
     project_key: str = Field(..., description="Project key to sync")
+    custom_fields: tuple[str, ...] | None = Field(
+        default=None,
+        description="Custom field IDs to fetch and sync; None fetches every field",
+    )
 
 
 class DynamoDBConfig(BaseModel):
     """Configuration for DynamoDB."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     table_name: str = Field(default="jira-sync-state", description="DynamoDB table name")
     region: str = Field(default="us-east-1", description="AWS region")
+    record_cache_ttl_seconds: float = Field(
+        default=30, description="How long sync records read or written by this process are reused; 0 disables"
+    )
 
 
 class SyncConfig(BaseModel):
     """Main sync configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     jira_instance_1: JiraConfig
     jira_instance_2: JiraConfig
     dynamodb: DynamoDBConfig
     webhook_secret: str = Field(..., description="Webhook authentication secret")
     sync_interval_seconds: int = Field(default=300, description="Fallback sync interval in seconds")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
-    retry_delay_seconds: int = Field(default=5, description="Delay between retries")
     sync_status_transitions: bool = Field(
         default=True, description="Whether to sync status changes using JIRA transitions"
     )
@@ -37,32 +51,72 @@ class SyncConfig(BaseModel):
         default=False, description="Whether to sync assignee (users may not exist in both instances)"
     )
     sync_comments: bool = Field(default=True, description="Whether to sync comments between instances")
+    jira_cache_ttl_seconds: float = Field(
+        default=60, description="How long fetched issues and transitions are reused before refetching"
+    )
+    full_sync_workers: int = Field(default=8, description="Issues synced concurrently during a full sync")
+    webhook_queue_url: str | None = Field(
+        default=None, description="SQS queue verified webhooks are handed to; None syncs them inline"
+    )
 
 
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+# An empty value counts as false, as it did under python-decouple
+_FALSY = frozenset({"0", "false", "no", "off", "n", "f", ""})
+
+
+def _env_list(env: dict[str, str], name: str) -> tuple[str, ...] | None:
+    """Parse a comma-separated list from the environment snapshot."""
+    value = env.get(name)
+    return None if value is None else tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+def _env_bool(env: dict[str, str], name: str, default: bool) -> bool:
+    """Parse a boolean flag from the environment snapshot, rejecting values that are neither true nor false."""
+    value = env.get(name)
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    if normalized in _TRUTHY:
+        return True
+    if normalized in _FALSY:
+        return False
+    raise ValueError(f"{name} must be a boolean (e.g. true or false), got {value!r}")
+
+
+@lru_cache(maxsize=1)
 def load_config() -> SyncConfig:
-    """Load configuration from environment variables."""
+    """Load configuration from environment variables (cached for the process lifetime)."""
+    # Snapshot the environment once and parse scalars directly
+    env = dict(os.environ)
+
     return SyncConfig(
         jira_instance_1=JiraConfig(
-            base_url=config("JIRA_1_BASE_URL"),
-            username=config("JIRA_1_USERNAME"),
-            api_token=config("JIRA_1_API_TOKEN"),
-            project_key=config("JIRA_1_PROJECT_KEY"),
+            base_url=env["JIRA_1_BASE_URL"],
+            username=env["JIRA_1_USERNAME"],
+            api_token=env["JIRA_1_API_TOKEN"],
+            project_key=env["JIRA_1_PROJECT_KEY"],
+            custom_fields=_env_list(env, "JIRA_1_CUSTOM_FIELDS"),
         ),
         jira_instance_2=JiraConfig(
-            base_url=config("JIRA_2_BASE_URL"),
-            username=config("JIRA_2_USERNAME"),
-            api_token=config("JIRA_2_API_TOKEN"),
-            project_key=config("JIRA_2_PROJECT_KEY"),
+            base_url=env["JIRA_2_BASE_URL"],
+            username=env["JIRA_2_USERNAME"],
+            api_token=env["JIRA_2_API_TOKEN"],
+            project_key=env["JIRA_2_PROJECT_KEY"],
+            custom_fields=_env_list(env, "JIRA_2_CUSTOM_FIELDS"),
         ),
         dynamodb=DynamoDBConfig(
-            table_name=config("DYNAMODB_TABLE_NAME", default="jira-sync-state"),
-            region=config("AWS_REGION", default="us-east-1"),
+            table_name=env.get("DYNAMODB_TABLE_NAME", "jira-sync-state"),
+            region=env.get("AWS_REGION", "us-east-1"),
+            record_cache_ttl_seconds=float(env.get("DYNAMODB_RECORD_CACHE_TTL_SECONDS", "30")),
         ),
-        webhook_secret=config("WEBHOOK_SECRET"),
-        sync_interval_seconds=config("SYNC_INTERVAL_SECONDS", default=300, cast=int),
-        max_retries=config("MAX_RETRIES", default=3, cast=int),
-        retry_delay_seconds=config("RETRY_DELAY_SECONDS", default=5, cast=int),
-        sync_status_transitions=config("SYNC_STATUS_TRANSITIONS", default=True, cast=bool),
-        sync_assignee=config("SYNC_ASSIGNEE", default=False, cast=bool),
-        sync_comments=config("SYNC_COMMENTS", default=True, cast=bool),
+        webhook_secret=env["WEBHOOK_SECRET"],
+        sync_interval_seconds=int(env.get("SYNC_INTERVAL_SECONDS", "300")),
+        max_retries=int(env.get("MAX_RETRIES", "3")),
+        sync_status_transitions=_env_bool(env, "SYNC_STATUS_TRANSITIONS", True),
+        sync_assignee=_env_bool(env, "SYNC_ASSIGNEE", False),
+        sync_comments=_env_bool(env, "SYNC_COMMENTS", True),
+        jira_cache_ttl_seconds=float(env.get("JIRA_CACHE_TTL_SECONDS", "60")),
+        full_sync_workers=int(env.get("FULL_SYNC_WORKERS", "8")),
+        webhook_queue_url=env.get("WEBHOOK_QUEUE_URL") or None,
     )
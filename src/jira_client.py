@@ -1,19 +1,171 @@
 """JIRA API client for sync operations."""
 
+import hashlib
+import json
+import random
 import re
+import threading
 import time
-from datetime import datetime
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import requests
 import structlog
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from .config import JiraConfig
 from .models import JiraComment, JiraIssue
+from .rate_limiter import TokenBucket
 
 logger = structlog.get_logger()
 
+# Connections kept alive per JIRA host
+HTTP_POOL_MAXSIZE = 32
+
+# Issue keys per "key in (...)" JQL search
+JQL_KEY_BATCH = 100
+
+# Standard fields consumed by _parse_issue
+ISSUE_FIELDS = (
+    "summary",
+    "description",
+    "issuetype",
+    "status",
+    "priority",
+    "assignee",
+    "reporter",
+    "labels",
+    "components",
+    "fixVersions",
+    "created",
+    "updated",
+    "resolution",
+    "comment",
+)
+
+# Body of comments created by the sync system; the marker regexes below parse it back
+SYNC_COMMENT_TEMPLATE = (
+    "[JIRA-SYNC] Original author: {author}{email}\n"
+    "[JIRA-SYNC] Source ID: {source_id}\n"
+    "[JIRA-SYNC] From: {source}\n"
+    "[JIRA-SYNC] Created: {created}\n"
+    "{updated_line}\n"
+    "---\n\n"
+    "{body}"
+)
+SYNC_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+
+# Maximum number of extracted ADF comment bodies kept per client
+ADF_TEXT_CACHE_SIZE = 4096
+
+# JQL date-time literals only have minute precision
+JQL_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# How far before its previous search get_project_issues_updated_since searches again, covering clock skew
+# and JIRA's search indexing delay
+UPDATED_SINCE_OVERLAP = timedelta(minutes=2)
+
+# Markers written into comments created by the sync system
+_SYNC_PREFIX_RE = re.compile(r"\s*\[JIRA-SYNC\]")
+_ORIGINAL_AUTHOR_RE = re.compile(r"\[JIRA-SYNC\] Original author: (.+?)\n")
+_SOURCE_ID_RE = re.compile(r"\[JIRA-SYNC\] Source ID: (.+?)\n")
+
+
+def is_sync_comment_body(body: str) -> bool:
+    """Check whether comment text was written by the sync system."""
+    return _SYNC_PREFIX_RE.match(body) is not None
+
+
+def _backoff_delay(
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> float:
+    """Capped exponential backoff with full jitter so concurrent clients don't retry in lockstep."""
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))  # noqa: S311
+
+
+@lru_cache(maxsize=256)
+def _named(name: str) -> dict[str, str]:
+    """Return a shared ``{"name": ...}`` reference; payloads are only serialized, never mutated."""
+    return {"name": name}
+
+
+def _description_to_adf(description: str | None) -> dict[str, Any] | None:
+    """Wrap plain-text description in a single-paragraph ADF document."""
+    if not description:
+        return None
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [{"type": "text", "text": description}],
+            }
+        ],
+    }
+
+
+def _jql_minute(moment: datetime, like: datetime) -> str:
+    """Format ``moment`` as a JQL date-time literal, in ``like``'s timezone when it has one."""
+    if like.tzinfo is not None:
+        moment = moment.astimezone(like.tzinfo)
+    return moment.strftime(JQL_DATETIME_FORMAT)
+
+
+def _index_transitions(transitions: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index transitions by case-folded target status name (first transition wins on duplicates)."""
+    by_status: dict[str, dict[str, Any]] = {}
+    for transition in transitions:
+        by_status.setdefault(transition.get("to", {}).get("name", "").casefold(), transition)
+    return by_status
+
+
+def _first_adf_text(document: dict[str, Any]) -> str:
+    """Return the first text node of an ADF document's first block, or "" if it has none."""
+    try:
+        return document["content"][0]["content"][0].get("text", "")
+    except (KeyError, IndexError, TypeError):
+        return ""
+
+
+def _unwrap_custom_field(value: Any) -> Any:
+    """Reduce option-style custom field values (``{"value": ...}``) to their plain value."""
+    if isinstance(value, dict):
+        return value.get("value", value)
+    if isinstance(value, list):
+        return [item.get("value", item) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+def _name_of(value: dict[str, Any] | None) -> str:
+    """Return the ``name`` of a JIRA object field such as status or priority."""
+    return value.get("name", "") if value else ""
+
+
+def _assignee_to_jira(assignee: str | None) -> dict[str, str] | None:
+    """Build the assignee reference by email, or None to unassign."""
+    return {"emailAddress": assignee} if assignee else None
+
+
+# Issue attributes diffed by convert_to_update_payload:
+# (JiraIssue attribute, JIRA field, value converter, whether the value is an unordered set of names).
+# JIRA doesn't guarantee the order of labels, components or versions, so those compare as sets.
+# Assignee is handled separately because syncing it is optional.
+UPDATE_FIELD_DESCRIPTORS: tuple[tuple[str, str, Callable[[Any], Any], bool], ...] = (
+    ("summary", "summary", lambda value: value, False),
+    ("description", "description", _description_to_adf, False),
+    ("priority", "priority", _named, False),
+    ("labels", "labels", lambda value: value, True),
+    ("components", "components", lambda value: [_named(comp) for comp in value], True),
+    ("fix_versions", "fixVersions", lambda value: [_named(ver) for ver in value], True),
+)
+
 
 class JiraAPIError(Exception):
     """Custom exception for JIRA API errors."""
@@ -27,20 +179,82 @@ class JiraAPIError(Exception):
 class JiraClient:
     """JIRA API client with authentication and CRUD operations."""
 
-    def __init__(self, config: JiraConfig, sync_assignee: bool = False) -> None:
+    def __init__(
+        self,
+        config: JiraConfig,
+        sync_assignee: bool = False,
+        async_workers: int = 5,
+        cache_ttl_seconds: float = 60,
+        max_requests_per_second: float = 10.0,
+        transition_cache_ttl_seconds: float = 600,
+    ) -> None:
         """Initialize JIRA client."""
         self.config = config
         self.sync_assignee = sync_assignee
+        # Shared by all threads using this client; adapts to 429 responses
+        self._rate_limiter = TokenBucket(max_rate=max_requests_per_second)
+        # Monotonic time before which no request is sent, set from 429 Retry-After
+        self._rate_limited_until = 0.0
+        # Last (fill rate, interval) advertised in rate-limit headers, to skip re-applying unchanged values
+        self._advertised_rate: tuple[str, str] | None = None
+        # Short-lived caches keyed by issue key: (fetched_at, value)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._issue_cache: dict[str, tuple[float, JiraIssue]] = {}
+        self._transitions_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        # Workflow transitions shared by every issue of a type in a given status: (issue_type, status)
+        self.transition_cache_ttl_seconds = transition_cache_ttl_seconds
+        self._transitions_by_status: dict[tuple[str, str], tuple[float, dict[str, dict[str, Any]]]] = {}
+        # State of get_project_issues_updated_since: (since, high-water mark, issues by key), with both
+        # times as JQL date-time literals; every update before the high-water mark has been seen
+        self._updated_since: tuple[str, str, dict[str, JiraIssue]] | None = None
+        # Plain text extracted from ADF comment bodies, keyed by (comment_id, updated)
+        self._adf_text_cache: dict[tuple[str, str], str] = {}
+        # Bounded pool for concurrent, network-bound requests (threads start lazily)
+        self._executor = ThreadPoolExecutor(max_workers=async_workers, thread_name_prefix="jira-client")
         self.base_url = config.base_url.rstrip("/")
+        self._api_base = f"{self.base_url}/rest/api/3/"
+        # Without an explicit custom-field allowlist every field is requested so all custom fields still sync
+        if config.custom_fields is None:
+            self._issue_fields = ["*all"]
+        else:
+            self._issue_fields = [*ISSUE_FIELDS, *config.custom_fields]
+        # Largest search page the server actually returns, learned from the first capped response
+        self._search_page_cap: int | None = None
         self.auth = HTTPBasicAuth(config.username, config.api_token)
-        self.session = requests.Session()
-        self.session.auth = self.auth
-        self.session.headers.update(
-            {
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            }
-        )
+        # The HTTP session is built on first request; payload builders never touch the network
+        self._pool_maxsize = max(async_workers, HTTP_POOL_MAXSIZE)
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session shared by all requests, created on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    session.auth = self.auth
+                    # Keep enough pooled keep-alive connections that concurrent calls reuse sockets instead
+                    # of churning them; retries are handled in _make_request, not by urllib3
+                    adapter = HTTPAdapter(pool_maxsize=self._pool_maxsize, pool_block=False, max_retries=0)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update(
+                        {
+                            "Accept": "application/json",
+                            "Content-Type": "application/json",
+                            "Connection": "keep-alive",
+                        }
+                    )
+                    self._session = session
+        return self._session
+
+    def warm_up(self) -> None:
+        """Open a pooled keep-alive connection to JIRA so the first API call skips the TLS handshake."""
+        try:
+            self.session.head(self.base_url, timeout=5)
+        except requests.exceptions.RequestException as e:
+            logger.warning("JIRA warm-up request failed", base_url=self.base_url, error=str(e))
 
     def _make_request(
         self,
@@ -49,12 +263,24 @@ class JiraClient:
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         max_retries: int = 3,
+        rate_limit_retries: int = 5,
     ) -> dict[str, Any] | dict[Any, Any] | None:
-        """Make HTTP request to JIRA API with retries."""
-        url = f"{self.base_url}/rest/api/3/{endpoint.lstrip('/')}"
+        """Make HTTP request to JIRA API with retries.
+
+        429 responses are retried separately from errors (up to ``rate_limit_retries``) and pause
+        every request made through this client until the server's Retry-After has passed.
+        """
+        url = self._api_base + endpoint.lstrip("/")
 
-        for attempt in range(max_retries):
+        attempt = 0
+        rate_limit_hits = 0
+        while True:
             try:
+                # Honour a Retry-After set by any thread before spending a token
+                pause = self._rate_limited_until - time.monotonic()
+                if pause > 0:
+                    time.sleep(pause)
+                self._rate_limiter.acquire()
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -62,15 +288,40 @@ class JiraClient:
                     params=params,
                     timeout=30,
                 )
+                self._apply_rate_limit_headers(response.headers)
 
                 if response.status_code == 429:  # Rate limited
-                    retry_after = int(response.headers.get("Retry-After", 60))
+                    self._rate_limiter.on_throttled()
+                    if rate_limit_hits >= rate_limit_retries:
+                        logger.error("JIRA rate limit persisted, giving up", url=url, retries=rate_limit_hits)
+                        raise JiraAPIError(f"JIRA rate limit persisted after {rate_limit_hits} retries", 429)
+                    rate_limit_hits += 1
+                    retry_after_header = response.headers.get("Retry-After")
+                    # Jitter on top of Retry-After so throttled clients don't all return at the same instant
+                    retry_after = (
+                        int(retry_after_header) + random.uniform(0, 1)  # noqa: S311
+                        if retry_after_header
+                        else _backoff_delay(rate_limit_hits - 1)
+                    )
+                    self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + retry_after)
                     logger.warning(
                         "Rate limited, waiting",
                         retry_after=retry_after,
-                        attempt=attempt + 1,
+                        rate_limit_retry=rate_limit_hits,
+                    )
+                    continue
+
+                if response.status_code >= 500 and attempt < max_retries - 1:
+                    # Server-side errors are transient; client errors (4xx) are not retried
+                    wait_time = _backoff_delay(attempt)
+                    attempt += 1
+                    logger.warning(
+                        "JIRA server error, retrying",
+                        status_code=response.status_code,
+                        attempt=attempt,
+                        wait_time=wait_time,
                     )
-                    time.sleep(retry_after)
+                    time.sleep(wait_time)
                     continue
 
                 if not response.ok:
@@ -83,37 +334,98 @@ class JiraClient:
                     )
                     raise JiraAPIError(error_msg, response.status_code)
 
-                return response.json() if response.content else {}
+                self._rate_limiter.on_success()
+                # Decode the raw bytes directly; json.loads detects the UTF encoding itself
+                return json.loads(response.content) if response.content else {}
 
             except requests.exceptions.RequestException as e:
                 if attempt == max_retries - 1:
-                    raise JiraAPIError(f"Request failed after {max_retries} attempts: {e}") from e  # will from e work?
+                    raise JiraAPIError(f"Request failed after {max_retries} attempts: {e}") from e
 
-                wait_time = 2**attempt
+                wait_time = _backoff_delay(attempt)
+                attempt += 1
                 logger.warning(
                     "Request failed, retrying",
                     error=str(e),
-                    attempt=attempt + 1,
+                    attempt=attempt,
                     wait_time=wait_time,
                 )
                 time.sleep(wait_time)
 
-        raise JiraAPIError(f"Request failed after {max_retries} attempts")
+    def _apply_rate_limit_headers(self, headers: Any) -> None:
+        """Pace requests by the token bucket JIRA advertises in its rate-limit headers, when present.
+
+        The advertised fill rate (tokens per interval) caps the client's own bucket, and an exhausted
+        server bucket pauses the client for one interval instead of waiting for a 429.
+        """
+        fill_rate = headers.get("X-RateLimit-FillRate")
+        interval = headers.get("X-RateLimit-Interval-Seconds")
+        if not fill_rate or not interval:
+            return
+
+        try:
+            if (fill_rate, interval) != self._advertised_rate:
+                self._advertised_rate = (fill_rate, interval)
+                self._rate_limiter.set_max_rate(float(fill_rate) / float(interval))
+            if headers.get("X-RateLimit-Remaining") == "0":
+                self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + float(interval))
+        except (ValueError, ZeroDivisionError):
+            logger.debug("Ignoring malformed rate limit headers", fill_rate=fill_rate, interval=interval)
+
+    def _cache_lookup(
+        self,
+        cache: dict[Any, tuple[float, Any]],
+        key: Any,
+        ttl_seconds: float | None = None,
+    ) -> Any | None:
+        """Return a cached value if it is still within the TTL (the client's issue TTL by default)."""
+        ttl = self.cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    def invalidate_issue(self, issue_key: str) -> None:
+        """Drop cached data for an issue after it has been modified."""
+        self._issue_cache.pop(issue_key, None)
+        self._transitions_cache.pop(issue_key, None)
+
+    def get_issue(self, issue_key: str, use_cache: bool = True) -> JiraIssue:
+        """Get JIRA issue by key.
+
+        With ``use_cache=False`` the issue is always fetched, and the fresh copy replaces the cached one.
+        """
+        if use_cache:
+            cached = self._cache_lookup(self._issue_cache, issue_key)
+            if cached is not None:
+                return cached
 
-    def get_issue(self, issue_key: str) -> JiraIssue:
-        """Get JIRA issue by key."""
         logger.info("Fetching JIRA issue", issue_key=issue_key)
 
         data = self._make_request(
             "GET",
             f"issue/{issue_key}",
-            params={
-                "expand": "changelog",
-                "fields": "*all",
-            },
+            params={"fields": ",".join(self._issue_fields)},
         )
 
-        return self._parse_issue(data)
+        issue = self._parse_issue(data)
+        self._issue_cache[issue_key] = (time.monotonic(), issue)
+        return issue
+
+    def search_issues_by_keys(self, issue_keys: list[str]) -> dict[str, JiraIssue]:
+        """Fetch issues by key with one JQL search per JQL_KEY_BATCH keys, refreshing the issue cache.
+
+        The searches run with validateQuery "warn", so keys of deleted issues do not fail their batch with
+        HTTP 400; those keys, like any other the search does not return, are absent from the result.
+        """
+        issues: dict[str, JiraIssue] = {}
+        for start in range(0, len(issue_keys), JQL_KEY_BATCH):
+            chunk = issue_keys[start : start + JQL_KEY_BATCH]
+            now = time.monotonic()
+            for issue in self.search_all(f"key in ({','.join(chunk)})", batch_size=len(chunk), validate_query="warn"):
+                issues[issue.key] = issue
+                self._issue_cache[issue.key] = (now, issue)
+        return issues
 
     def create_issue(self, issue_data: dict[str, Any]) -> JiraIssue:
         """Create a new JIRA issue."""
@@ -128,24 +440,61 @@ class JiraClient:
         issue_key = data["key"]
         return self.get_issue(issue_key)
 
-    def update_issue(self, issue_key: str, update_data: dict[str, Any]) -> JiraIssue:
-        """Update an existing JIRA issue."""
+    def update_issue(
+        self,
+        issue_key: str,
+        update_data: dict[str, Any],
+        return_issue: bool = True,
+    ) -> JiraIssue | None:
+        """Update an existing JIRA issue.
+
+        The updated issue comes back in the PUT response (``returnIssue``), so no follow-up GET is
+        made unless the response carries no issue; pass ``return_issue=False`` when the caller does not
+        need it.
+        """
         logger.info("Updating JIRA issue", issue_key=issue_key)
 
-        self._make_request("PUT", f"issue/{issue_key}", data=update_data)
+        params = {"returnIssue": "true"} if return_issue else None
+        try:
+            data = self._make_request("PUT", f"issue/{issue_key}", data=update_data, params=params)
+        except json.JSONDecodeError:
+            # The update was applied; only the response body is unreadable
+            data = {}
+        self.invalidate_issue(issue_key)
 
-        # Return updated issue
-        return self.get_issue(issue_key)
+        if not return_issue:
+            return None
+
+        try:
+            issue = self._parse_issue(data)
+        except (KeyError, TypeError, ValueError) as e:
+            # No usable issue in the response (e.g. a 204 with no body); fetch it rather than fail the update
+            logger.debug("Update response carried no issue, fetching it", issue_key=issue_key, error=str(e))
+            return self.get_issue(issue_key)
+        self._issue_cache[issue_key] = (time.monotonic(), issue)
+        return issue
 
     def search_issues(
         self,
         jql: str,
         start_at: int = 0,
-        max_results: int = 50,
+        max_results: int = 500,
     ) -> list[JiraIssue]:
         """Search for issues using JQL."""
-        logger.info("Searching JIRA issues", jql=jql)
+        return self._search_page(jql, start_at, max_results)[0]
+
+    def _search_page(
+        self, jql: str, start_at: int, max_results: int, validate_query: str = "strict"
+    ) -> tuple[list[JiraIssue], int]:
+        """Fetch one page of JQL results, returning the parsed issues and the server's total.
+
+        ``validate_query`` is JIRA's validateQuery mode; "warn" lets a query naming missing issue keys
+        return the rest instead of failing with HTTP 400.
+        """
+        logger.info("Searching JIRA issues", jql=jql, start_at=start_at)
 
+        if self._search_page_cap is not None:
+            max_results = min(max_results, self._search_page_cap)
         data = self._make_request(
             "POST",
             "search",
@@ -153,30 +502,128 @@ class JiraClient:
                 "jql": jql,
                 "startAt": start_at,
                 "maxResults": max_results,
-                "fields": "*all",
-                "expand": ["changelog"],
+                "fields": self._issue_fields,
+                "validateQuery": validate_query,
             },
         )
 
-        return [self._parse_issue(issue_data) for issue_data in data["issues"]]
+        # Release each raw issue dict as soon as it is parsed so raw and parsed pages don't peak together
+        raw_issues = data.pop("issues")
+        total = data.get("total", 0)
+        if len(raw_issues) < max_results and start_at + len(raw_issues) < total:
+            # The server silently capped the page size; ask for no more than that from now on
+            logger.warning("JIRA capped search page size", requested=max_results, returned=len(raw_issues))
+            self._search_page_cap = len(raw_issues)
+
+        raw_issues.reverse()
+        issues = []
+        while raw_issues:
+            issues.append(self._parse_issue(raw_issues.pop()))
+        return issues, total
+
+    def search_all(
+        self,
+        jql: str,
+        batch_size: int = 500,
+        max_results: int | None = None,
+        validate_query: str = "strict",
+    ) -> list[JiraIssue]:
+        """Search for every issue matching JQL, fetching result pages concurrently.
+
+        The first page reports the total (and the server's effective page size), after which all
+        remaining offsets are requested at once on the client's executor. ``max_results`` caps the
+        number of issues returned; ``validate_query`` is passed through as for _search_page.
+        """
+        first_page, total = self._search_page(jql, 0, min(batch_size, max_results or batch_size), validate_query)
+        if max_results is not None:
+            total = min(total, max_results)
+        if not first_page or len(first_page) >= total:
+            return first_page[:total]
+
+        page_size = len(first_page)
+        logger.info("Searching remaining JIRA issues in pages", jql=jql, total=total, page_size=page_size)
+
+        pages = self._executor.map(
+            lambda start_at: self._search_page(jql, start_at, min(page_size, total - start_at), validate_query)[0],
+            range(page_size, total, page_size),
+        )
+        return first_page + [issue for page in pages for issue in page]
+
+    def iter_issue_updates(
+        self, jql: str, batch_size: int = 500, max_results: int | None = None
+    ) -> Iterator[tuple[str, datetime]]:
+        """Yield (key, updated) for issues matching JQL, one result page at a time.
+
+        Only the key and updated timestamp are requested, so pages are small and no issue is parsed;
+        callers fetch the issues they need individually. The next page is requested only once the
+        current one has been consumed.
+        """
+        start_at = 0
+        while max_results is None or start_at < max_results:
+            page_size = batch_size if max_results is None else min(batch_size, max_results - start_at)
+            data = self._make_request(
+                "POST",
+                "search",
+                data={"jql": jql, "startAt": start_at, "maxResults": page_size, "fields": ["updated"]},
+            )
+            page = [
+                (issue["key"], datetime.fromisoformat(issue["fields"]["updated"])) for issue in data.get("issues", [])
+            ]
+            yield from page
+
+            # Advance by what was returned, so a server-side page cap needs no special handling
+            start_at += len(page)
+            if not page or start_at >= data.get("total", 0):
+                return
 
     def get_project_issues_updated_since(
         self,
         since: datetime,
-        max_results: int = 100,
+        max_results: int = 1000,
     ) -> list[JiraIssue]:
-        """Get all issues in the project updated since a specific datetime."""
-        since_str = since.strftime("%Y-%m-%d %H:%M")
-        jql = f'project = "{self.config.project_key}" AND updated >= "{since_str}"'
-
-        return self.search_issues(jql, max_results=max_results)
+        """Get all issues in the project updated since a specific datetime.
+
+        Issues returned by an earlier call with the same or an earlier ``since`` are kept, and JIRA is only
+        searched for updates made since shortly before that call's search. A ``maxResults=0`` probe counts
+        the matches first, so a poll that finds nothing new costs one small request and fetches no pages.
+        """
+        since_str = since.strftime(JQL_DATETIME_FORMAT)
+        state = self._updated_since
+        if state is None or since_str < state[0]:
+            known: dict[str, JiraIssue] = {}
+            search_from = since_str
+        else:
+            known = {key: issue for key, issue in state[2].items() if _jql_minute(issue.updated, since) >= since_str}
+            search_from = max(since_str, state[1])
+
+        # Read the clock before searching: whatever JIRA has indexed by then is in this search's results
+        high_water_mark = (datetime.now(since.tzinfo) - UPDATED_SINCE_OVERLAP).strftime(JQL_DATETIME_FORMAT)
+        jql = f'project = "{self.config.project_key}" AND updated >= "{search_from}"'
+        fresh = self.search_all(jql, max_results=max_results) if self._search_total(jql) else []
+        for issue in fresh:
+            known[issue.key] = issue
+
+        # Truncated results cannot be extended incrementally
+        self._updated_since = (since_str, high_water_mark, known) if len(fresh) < max_results else None
+        return list(known.values())[:max_results]
+
+    def _search_total(self, jql: str) -> int:
+        """Count the issues matching JQL with a search that returns no issues."""
+        data = self._make_request("POST", "search", data={"jql": jql, "maxResults": 0, "fields": []})
+        return data.get("total", 0)
 
     def get_transitions(self, issue_key: str) -> list[dict[str, Any]]:
         """Get available transitions for an issue."""
+        cached = self._cache_lookup(self._transitions_cache, issue_key)
+        if cached is not None:
+            return cached
+
         logger.info("Getting transitions for issue", issue_key=issue_key)
 
         data = self._make_request("GET", f"issue/{issue_key}/transitions")
-        return data.get("transitions", [])
+        transitions = data.get("transitions", [])
+        self._transitions_cache[issue_key] = (time.monotonic(), transitions)
+        return transitions
 
     def transition_issue(self, issue_key: str, transition_id: str, fields: dict[str, Any] | None = None) -> None:
         """Transition an issue to a new status."""
@@ -188,28 +635,49 @@ class JiraClient:
             transition_data["fields"] = fields
 
         self._make_request("POST", f"issue/{issue_key}/transitions", data=transition_data)
-
-    def transition_issue_to_status(self, issue_key: str, target_status: str) -> bool:
-        """Transition an issue to a specific status by finding the appropriate transition."""
+        self.invalidate_issue(issue_key)
+
+    def _transitions_for_state(self, issue_key: str, issue_type: str | None, status: str) -> dict[str, dict[str, Any]]:
+        """Get the workflow transitions out of a status, fetching them via ``issue_key`` on a cache miss."""
+        graph_key = (issue_type or "", status)
+        index = self._cache_lookup(self._transitions_by_status, graph_key, self.transition_cache_ttl_seconds)
+        if index is None:
+            index = _index_transitions(self.get_transitions(issue_key))
+            self._transitions_by_status[graph_key] = (time.monotonic(), index)
+        return index
+
+    def transition_issue_to_status(
+        self,
+        issue_key: str,
+        target_status: str,
+        current_status: str | None = None,
+        issue_type: str | None = None,
+        per_issue_transitions: bool = False,
+    ) -> bool:
+        """Transition an issue to a specific status by finding the appropriate transition.
+
+        Callers that already hold the issue can pass ``current_status`` and ``issue_type`` to skip
+        re-fetching it. Available transitions are cached per (issue type, status) since they come from
+        the workflow; set ``per_issue_transitions`` when workflow conditions depend on the issue itself.
+        """
         logger.info("Attempting to transition issue to status", issue_key=issue_key, target_status=target_status)
 
         try:
-            # Get current issue to check if already in target status
-            current_issue = self.get_issue(issue_key)
-            if current_issue.status == target_status:
+            # Get current status (if not supplied) to check if already in target status
+            if current_status is None:
+                current_issue = self.get_issue(issue_key)
+                current_status = current_issue.status
+                issue_type = current_issue.issue_type
+            if current_status == target_status:
                 logger.info("Issue already in target status", issue_key=issue_key, status=target_status)
                 return True
 
-            # Get available transitions
-            transitions = self.get_transitions(issue_key)
-
-            # Find transition that leads to target status
-            target_transition = None
-            for transition in transitions:
-                transition_to_status = transition.get("to", {}).get("name", "")
-                if transition_to_status.lower() == target_status.lower():
-                    target_transition = transition
-                    break
+            # Get available transitions, shared across issues in the same workflow state
+            if per_issue_transitions:
+                by_status = _index_transitions(self.get_transitions(issue_key))
+            else:
+                by_status = self._transitions_for_state(issue_key, issue_type, current_status)
+            target_transition = by_status.get(target_status.casefold())
 
             if target_transition:
                 transition_id = target_transition["id"]
@@ -217,24 +685,25 @@ class JiraClient:
                 logger.info(
                     "Successfully transitioned issue",
                     issue_key=issue_key,
-                    from_status=current_issue.status,
+                    from_status=current_status,
                     to_status=target_status,
                     transition_id=transition_id,
                 )
                 return True
             else:
                 # Log available transitions for debugging
-                available_statuses = [t.get("to", {}).get("name", "") for t in transitions]
                 logger.warning(
                     "No direct transition found to target status",
                     issue_key=issue_key,
-                    current_status=current_issue.status,
+                    current_status=current_status,
                     target_status=target_status,
-                    available_transitions=available_statuses,
+                    available_transitions=list(by_status),
                 )
                 return False
 
         except JiraAPIError as e:
+            # A rejected transition may mean the cached workflow state is stale
+            self._transitions_by_status.pop((issue_type or "", current_status or ""), None)
             logger.error(
                 "Failed to transition issue",
                 issue_key=issue_key,
@@ -243,6 +712,22 @@ class JiraClient:
             )
             return False
 
+    def parse_webhook_issue(self, issue_data: dict[str, Any]) -> JiraIssue | None:
+        """Parse the issue embedded in a webhook payload, or None if it cannot stand in for a fetched issue.
+
+        The result is not cached: a delivery can be older than what JIRA currently holds. Webhooks send the
+        REST v2 representation, whose description is wiki markup rather than the ADF fetched issues carry;
+        such a payload would never compare equal to the target, so the issue is fetched instead.
+        """
+        fields = issue_data.get("fields")
+        if not isinstance(fields, dict) or isinstance(fields.get("description"), str):
+            return None
+        try:
+            return self._parse_issue(issue_data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug("Webhook issue payload not usable, fetching instead", error=str(e))
+            return None
+
     def _parse_issue(self, issue_data: dict[str, Any]) -> JiraIssue:
         """Parse JIRA issue data into our standardized model."""
         fields = issue_data["fields"]
@@ -251,12 +736,12 @@ class JiraClient:
         summary = fields.get("summary", "")
         description = fields.get("description", {})
         if isinstance(description, dict):
-            description = description.get("content", [{}])[0].get("content", [{}])[0].get("text", "")
+            description = _first_adf_text(description)
 
-        # Extract complex fields safely
-        issue_type = fields.get("issuetype", {}).get("name", "")
-        status = fields.get("status", {}).get("name", "")
-        priority = fields.get("priority", {}).get("name", "")
+        # Extract complex fields safely (JIRA sends null for unset objects)
+        issue_type = _name_of(fields.get("issuetype"))
+        status = _name_of(fields.get("status"))
+        priority = _name_of(fields.get("priority"))
 
         assignee = None
         if fields.get("assignee"):
@@ -272,14 +757,15 @@ class JiraClient:
         fix_versions = [ver["name"] for ver in fields.get("fixVersions", [])]
 
         # Extract timestamps
-        created = datetime.fromisoformat(fields["created"].replace("Z", "+00:00"))
-        updated = datetime.fromisoformat(fields["updated"].replace("Z", "+00:00"))
+        created = datetime.fromisoformat(fields["created"])
+        updated = datetime.fromisoformat(fields["updated"])
 
         resolution = fields.get("resolution", {})
         resolution_name = resolution.get("name") if resolution else None
 
         # Extract comments
         comments = self._parse_comments(issue_data.get("fields", {}).get("comment", {}).get("comments", []))
+        custom_fields = self._extract_custom_fields(fields)
 
         return JiraIssue(
             key=issue_data["key"],
@@ -293,31 +779,59 @@ class JiraClient:
             labels=labels,
             components=components,
             fix_versions=fix_versions,
-            custom_fields=self._extract_custom_fields(fields),
+            custom_fields=custom_fields,
             created=created,
             updated=updated,
             resolution=resolution_name,
             comments=comments,
+            content_hash=self._content_hash(
+                summary, description, priority, assignee, labels, components, fix_versions, custom_fields
+            ),
         )
 
+    def _content_hash(
+        self,
+        summary: str,
+        description: str | None,
+        priority: str,
+        assignee: str | None,
+        labels: list[str],
+        components: list[str],
+        fix_versions: list[str],
+        custom_fields: dict[str, Any],
+    ) -> bytes:
+        """Digest the fields convert_to_update_payload diffs, so identical issues can skip the diff.
+
+        Equal digests imply an empty update; unequal ones just fall through to the field-by-field diff.
+        """
+        content = [
+            summary,
+            description,
+            priority,
+            assignee if self.sync_assignee else None,
+            sorted(labels),
+            sorted(components),
+            sorted(fix_versions),
+            custom_fields,
+        ]
+        encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+
     def _extract_custom_fields(self, fields: dict[str, Any]) -> dict[str, Any]:
         """Extract custom fields from JIRA issue fields."""
-        custom_fields = {}
-
-        for key, value in fields.items():
-            if key.startswith("customfield_"):
-                if value is not None:
-                    # Handle different custom field types
-                    if isinstance(value, dict):
-                        custom_fields[key] = value.get("value", value)
-                    elif isinstance(value, list):
-                        custom_fields[key] = [
-                            item.get("value", item) if isinstance(item, dict) else item for item in value
-                        ]
-                    else:
-                        custom_fields[key] = value
-
-        return custom_fields
+        if self.config.custom_fields is not None:
+            # Only the allowlisted fields were requested, so look those up directly
+            return {
+                key: _unwrap_custom_field(value)
+                for key in self.config.custom_fields
+                if (value := fields.get(key)) is not None
+            }
+
+        return {
+            key: _unwrap_custom_field(value)
+            for key, value in fields.items()
+            if value is not None and key.startswith("customfield_")
+        }
 
     def _parse_comments(self, comments_data: list[dict[str, Any]]) -> list[JiraComment]:
         """Parse JIRA comments data into our standardized model."""
@@ -331,8 +845,15 @@ class JiraClient:
             # Extract comment body (handle both string and ADF format)
             body = comment_data.get("body", "")
             if isinstance(body, dict):
-                # Handle Atlassian Document Format (ADF)
-                body = self._extract_text_from_adf(body)
+                # Handle Atlassian Document Format (ADF); unchanged comments reuse the extracted text
+                cache_key = (comment_data["id"], comment_data["updated"])
+                text = self._adf_text_cache.get(cache_key)
+                if text is None:
+                    text = self._extract_text_from_adf(body)
+                    if len(self._adf_text_cache) >= ADF_TEXT_CACHE_SIZE:
+                        self._adf_text_cache.clear()
+                    self._adf_text_cache[cache_key] = text
+                body = text
 
             # Extract author information
             author = comment_data.get("author", {})
@@ -340,8 +861,8 @@ class JiraClient:
             author_email = author.get("emailAddress")
 
             # Extract timestamps
-            created = datetime.fromisoformat(comment_data["created"].replace("Z", "+00:00"))
-            updated = datetime.fromisoformat(comment_data["updated"].replace("Z", "+00:00"))
+            created = datetime.fromisoformat(comment_data["created"])
+            updated = datetime.fromisoformat(comment_data["updated"])
 
             # Check if this is a sync comment
             is_sync_comment = self._is_sync_comment(body)
@@ -369,33 +890,33 @@ class JiraClient:
         if not isinstance(adf_content, dict):
             return str(adf_content)
 
-        content = adf_content.get("content", [])
+        # Iterative depth-first walk in document order, so nested nodes (lists, panels, ...) are covered
+        stack = list(reversed(adf_content.get("content", [])))
         text_parts = []
 
-        for item in content:
-            if isinstance(item, dict):
-                if item.get("type") == "paragraph":
-                    paragraph_content = item.get("content", [])
-                    for text_item in paragraph_content:
-                        if text_item.get("type") == "text":
-                            text_parts.append(text_item.get("text", ""))
-                elif item.get("type") == "text":
-                    text_parts.append(item.get("text", ""))
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            if node.get("type") == "text":
+                text_parts.append(node.get("text", ""))
+            elif "content" in node:
+                stack.extend(reversed(node["content"]))
 
         return " ".join(text_parts)
 
     def _is_sync_comment(self, body: str) -> bool:
         """Check if a comment was created by the sync system."""
-        return body.strip().startswith("[JIRA-SYNC]")
+        return is_sync_comment_body(body)
 
     def _extract_original_author(self, body: str) -> str | None:
         """Extract original author from sync comment."""
-        match = re.search(r"\[JIRA-SYNC\] Original author: (.+?)\n", body)
+        match = _ORIGINAL_AUTHOR_RE.search(body)
         return match.group(1) if match else None
 
     def _extract_sync_source_id(self, body: str) -> str | None:
         """Extract source comment ID from sync comment."""
-        match = re.search(r"\[JIRA-SYNC\] Source ID: (.+?)\n", body)
+        match = _SOURCE_ID_RE.search(body)
         return match.group(1) if match else None
 
     def get_comments(self, issue_key: str) -> list[JiraComment]:
@@ -420,10 +941,11 @@ class JiraClient:
         }
 
         response = self._make_request("POST", f"issue/{issue_key}/comment", data=comment_data)
+        self.invalidate_issue(issue_key)
 
-        # Get the created comment with full details
-        comment_id = response["id"]
-        return self.get_comment(issue_key, comment_id)
+        # The created comment is returned in full, no need to fetch it again
+        parsed_comments = self._parse_comments([response])
+        return parsed_comments[0] if parsed_comments else None
 
     def get_comment(self, issue_key: str, comment_id: str) -> JiraComment | None:
         """Get a specific comment."""
@@ -445,28 +967,45 @@ class JiraClient:
             }
         }
 
-        self._make_request("PUT", f"issue/{issue_key}/comment/{comment_id}", data=comment_data)
-        return self.get_comment(issue_key, comment_id)
+        response = self._make_request("PUT", f"issue/{issue_key}/comment/{comment_id}", data=comment_data)
+        self.invalidate_issue(issue_key)
+
+        # The updated comment is returned in full, no need to fetch it again
+        parsed_comments = self._parse_comments([response])
+        return parsed_comments[0] if parsed_comments else None
 
     def delete_comment(self, issue_key: str, comment_id: str) -> None:
         """Delete a comment."""
         logger.info("Deleting comment", issue_key=issue_key, comment_id=comment_id)
         self._make_request("DELETE", f"issue/{issue_key}/comment/{comment_id}")
+        self.invalidate_issue(issue_key)
+
+    def format_sync_comment_body(
+        self,
+        original_comment: JiraComment,
+        source_instance_name: str,
+        include_updated: bool = False,
+    ) -> str:
+        """Render a sync comment body with original author attribution."""
+        return SYNC_COMMENT_TEMPLATE.format(
+            author=original_comment.author_name,
+            email=f" ({original_comment.author_email})" if original_comment.author_email else "",
+            source_id=original_comment.id,
+            source=source_instance_name,
+            created=original_comment.created.strftime(SYNC_TIMESTAMP_FORMAT),
+            updated_line=(
+                f"[JIRA-SYNC] Updated: {original_comment.updated.strftime(SYNC_TIMESTAMP_FORMAT)}\n"
+                if include_updated
+                else ""
+            ),
+            body=original_comment.body,
+        )
 
     def create_sync_comment(
         self, issue_key: str, original_comment: JiraComment, source_instance_name: str
     ) -> JiraComment:
         """Create a sync comment with original author attribution."""
-        sync_body = (
-            f"[JIRA-SYNC] Original author: {original_comment.author_name}"
-            f"{f' ({original_comment.author_email})' if original_comment.author_email else ''}\n"
-            f"[JIRA-SYNC] Source ID: {original_comment.id}\n"
-            f"[JIRA-SYNC] From: {source_instance_name}\n"
-            f"[JIRA-SYNC] Created: {original_comment.created.strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
-            f"---\n\n"
-            f"{original_comment.body}"
-        )
-
+        sync_body = self.format_sync_comment_body(original_comment, source_instance_name)
         return self.add_comment(issue_key, sync_body)
 
     def convert_to_create_payload(self, issue: JiraIssue) -> dict[str, Any]:
@@ -475,32 +1014,23 @@ class JiraClient:
             "fields": {
                 "project": {"key": self.config.project_key},
                 "summary": issue.summary,
-                "issuetype": {"name": issue.issue_type},
-                "priority": {"name": issue.priority},
+                "issuetype": _named(issue.issue_type),
+                "priority": _named(issue.priority),
                 "labels": issue.labels,
             }
         }
 
         if issue.description:
-            payload["fields"]["description"] = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": issue.description}],
-                    }
-                ],
-            }
+            payload["fields"]["description"] = _description_to_adf(issue.description)
 
         if self.sync_assignee and issue.assignee:
             payload["fields"]["assignee"] = {"emailAddress": issue.assignee}  # Probably won't work...
 
         if issue.components:
-            payload["fields"]["components"] = [{"name": comp} for comp in issue.components]  # type: ignore
+            payload["fields"]["components"] = [_named(comp) for comp in issue.components]  # type: ignore
 
         if issue.fix_versions:
-            payload["fields"]["fixVersions"] = [{"name": ver} for ver in issue.fix_versions]  # type: ignore
+            payload["fields"]["fixVersions"] = [_named(ver) for ver in issue.fix_versions]  # type: ignore
 
         # Add custom fields, should we?
         for key, value in issue.custom_fields.items():
@@ -514,50 +1044,34 @@ class JiraClient:
         target_issue: JiraIssue,
     ) -> dict[str, Any]:
         """Convert differences between issues to JIRA update payload format."""
-        update_fields = {}
+        if current_issue.content_hash is not None and current_issue.content_hash == target_issue.content_hash:
+            return {}
 
-        # Compare and update fields that have changed
-        if current_issue.summary != target_issue.summary:
-            update_fields["summary"] = target_issue.summary
-
-        if current_issue.description != target_issue.description:
-            if target_issue.description:
-                update_fields["description"] = {  # type: ignore
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [{"type": "text", "text": target_issue.description}],
-                        }
-                    ],
-                }
-            else:
-                update_fields["description"] = None  # type: ignore
+        update_fields: dict[str, Any] = {}
 
-        if current_issue.priority != target_issue.priority:
-            update_fields["priority"] = {"name": target_issue.priority}  # type: ignore
+        # Compare and update fields that have changed
+        for attr, jira_field, to_jira, unordered in UPDATE_FIELD_DESCRIPTORS:
+            current_value = getattr(current_issue, attr)
+            target_value = getattr(target_issue, attr)
+            if current_value == target_value:
+                continue
+            if unordered and frozenset(current_value) == frozenset(target_value):
+                # Same names in a different order; not worth a PUT
+                continue
+            update_fields[jira_field] = to_jira(target_value)
 
         # Only sync assignee if configured to do so
         if self.sync_assignee and current_issue.assignee != target_issue.assignee:
-            if target_issue.assignee:
-                update_fields["assignee"] = {"emailAddress": target_issue.assignee}  # type: ignore
-            else:
-                update_fields["assignee"] = None  # type: ignore
-
-        if current_issue.labels != target_issue.labels:
-            update_fields["labels"] = target_issue.labels  # type: ignore
-
-        if current_issue.components != target_issue.components:
-            update_fields["components"] = [{"name": comp} for comp in target_issue.components]  # type: ignore
-
-        if current_issue.fix_versions != target_issue.fix_versions:
-            update_fields["fixVersions"] = [{"name": ver} for ver in target_issue.fix_versions]  # type: ignore
-
-        # Handle custom fields
-        for key, value in target_issue.custom_fields.items():
-            if current_issue.custom_fields.get(key) != value:
-                update_fields[key] = value
+            update_fields["assignee"] = _assignee_to_jira(target_issue.assignee)
+
+        # Handle custom fields; a single C-level dict comparison skips the per-key diff when nothing changed
+        current_custom_fields = current_issue.custom_fields
+        if current_custom_fields != target_issue.custom_fields:
+            update_fields.update(
+                (key, value)
+                for key, value in target_issue.custom_fields.items()
+                if current_custom_fields.get(key) != value
+            )
 
         # Note: Status changes are handled separately via transitions
         # We don't include status in the update payload
@@ -573,14 +1087,34 @@ class JiraClient:
         """Apply all updates to an issue including field changes and status transitions."""
         logger.info("Applying updates to issue", issue_key=issue_key)
 
-        # Apply field updates first
+        if (
+            current_issue.content_hash is not None
+            and current_issue.content_hash == target_issue.content_hash
+            and current_issue.status == target_issue.status
+        ):
+            logger.info("Issues already match, nothing to apply", issue_key=issue_key)
+            return current_issue
+
         update_payload = self.convert_to_update_payload(current_issue, target_issue)
+        status_changed = current_issue.status != target_issue.status
+
+        # Fetch the available transitions while the field update is in flight
+        transitions_prefetch = None
+        if status_changed and update_payload.get("fields"):
+            transitions_prefetch = self._executor.submit(
+                self._transitions_for_state, issue_key, current_issue.issue_type, current_issue.status
+            )
+
+        # Apply field updates first
         if update_payload.get("fields"):
-            self.update_issue(issue_key, update_payload)
+            self.update_issue(issue_key, update_payload, return_issue=False)
             logger.info("Applied field updates", issue_key=issue_key, fields=list(update_payload["fields"].keys()))
 
         # Handle status change separately using transitions
-        if current_issue.status != target_issue.status:
+        if status_changed:
+            if transitions_prefetch is not None:
+                # Wait for the prefetch; on failure the transition below simply fetches again
+                transitions_prefetch.exception()
             logger.info(
                 "Status change detected",
                 issue_key=issue_key,
@@ -588,7 +1122,9 @@ class JiraClient:
                 to_status=target_issue.status,
             )
 
-            status_success = self.transition_issue_to_status(issue_key, target_issue.status)
+            status_success = self.transition_issue_to_status(
+                issue_key, target_issue.status, current_issue.status, current_issue.issue_type
+            )
             if not status_success:
                 logger.warning(
                     "Status transition failed - issue may need manual intervention",
@@ -1,22 +1,74 @@
 """AWS Lambda handlers for JIRA webhook events and scheduled syncs."""
 
+import base64
 import hashlib
 import hmac
 import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
+import boto3
 import structlog
+from botocore.exceptions import BotoCoreError, ClientError
 
 from .config import SyncConfig, load_config
-from .models import WebhookPayload
+from .models import SyncDirection, WebhookPayload
 from .sync_engine import SyncEngine
 
+# Calls below LOG_LEVEL return immediately without running any processors, and each module's logger is
+# assembled once rather than on every call
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.getLevelNamesMapping().get(os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
+    ),
+    cache_logger_on_first_use=True,
+)
+
 logger = structlog.get_logger()
 
+# Shared encoder; compact separators keep response bodies small
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Webhook events that can trigger a sync
+RELEVANT_EVENTS = frozenset(
+    {
+        "jira:issue_created",
+        "jira:issue_updated",
+        "jira:issue_deleted",  # You might want to handle deletions
+    }
+)
+
+# Changelog fields that should trigger sync
+MEANINGFUL_FIELDS = frozenset(
+    {
+        "summary",
+        "description",
+        "priority",
+        # "assignee",
+        "labels",
+        "components",
+        "fixVersions",
+        "status",  # Include status changes
+        "resolution",
+    }
+)
+
+# Webhook paths that name the source instance: /jira1/webhook or /webhook/jira1 (and likewise for 2)
+_WEBHOOK_PATH_RE = re.compile(r"/(?:jira([12])/webhook|webhook/jira([12]))")
+
 # Global sync engine instance (reused across Lambda invocations)
 _sync_engine: SyncEngine | None = None
 
 
+def _response(status_code: int, body: dict[str, Any]) -> dict[str, Any]:
+    """Build an API Gateway response with a compact JSON body."""
+    return {"statusCode": status_code, "body": _JSON_ENCODER.encode(body)}
+
+
 def get_sync_engine() -> SyncEngine:
     """Get or create the global sync engine instance."""
     global _sync_engine
@@ -27,35 +79,58 @@ def get_sync_engine() -> SyncEngine:
     return _sync_engine
 
 
-def verify_webhook_signature(payload: str, signature: str, secret: str) -> bool:
+def _warm_start() -> None:
+    """Build the sync engine during the Lambda init phase so the first invocation doesn't pay for it."""
+    try:
+        get_sync_engine().warm_up()
+    except Exception as e:
+        # Leave it to the first invocation, which reports the failure properly
+        logger.warning("Sync engine warm start failed", error=str(e))
+
+
+@lru_cache(maxsize=1)
+def _sqs_client() -> Any:
+    """SQS client for handing webhooks to the queue, created on first use."""
+    return boto3.client("sqs")
+
+
+def enqueue_webhook(queue_url: str, body: str | bytes, source_instance: int) -> bool:
+    """Queue a verified webhook body for batch_webhook_handler; returns False if it could not be sent."""
+    try:
+        _sqs_client().send_message(
+            QueueUrl=queue_url,
+            MessageBody=body.decode("utf-8") if isinstance(body, bytes) else body,
+            MessageAttributes={"source_instance": {"DataType": "Number", "StringValue": str(source_instance)}},
+        )
+        return True
+    except (BotoCoreError, ClientError) as e:
+        logger.warning("Failed to queue webhook, syncing inline", error=str(e))
+        return False
+
+
+@lru_cache(maxsize=4)
+def _hmac_prototype(secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 state for a secret, copied per request instead of re-deriving the key."""
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def verify_webhook_signature(payload: str | bytes, signature: str, secret: str) -> bool:
     """Verify JIRA webhook signature."""
     if not signature:
         return False
 
     # JIRA webhooks use HMAC-SHA256
-    expected_signature = hmac.new(
-        secret.encode("utf-8"),
-        payload.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+    mac = _hmac_prototype(secret).copy()
+    mac.update(payload if isinstance(payload, bytes) else payload.encode("utf-8"))
 
     # Remove 'sha256=' prefix if present
-    if signature.startswith("sha256="):
-        signature = signature[7:]
-
-    return hmac.compare_digest(expected_signature, signature)
+    return hmac.compare_digest(mac.hexdigest(), signature.removeprefix("sha256="))
 
 
 def should_process_event(webhook_payload: WebhookPayload) -> bool:
     """Determine if the webhook event should be processed."""
     # Process issue creation and updates
-    relevant_events = [
-        "jira:issue_created",
-        "jira:issue_updated",
-        "jira:issue_deleted",  # You might want to handle deletions
-    ]
-
-    if webhook_payload.webhookEvent not in relevant_events:
+    if webhook_payload.webhookEvent not in RELEVANT_EVENTS:
         return False
 
     # For issue creation, always process
@@ -71,25 +146,12 @@ def should_process_event(webhook_payload: WebhookPayload) -> bool:
         # Process if there are meaningful field changes including status
         if webhook_payload.changelog:
             items = webhook_payload.changelog.get("items", [])
-            # Fields that should trigger sync
-            meaningful_fields = {
-                "summary",
-                "description",
-                "priority",
-                # "assignee",
-                "labels",
-                "components",
-                "fixVersions",
-                "status",  # Include status changes
-                "resolution",
-            }
-
             for item in items:
                 field_name = item.get("field", "")
-                if field_name in meaningful_fields:
+                if field_name in MEANINGFUL_FIELDS:
                     # Log status changes for debugging
                     if field_name == "status":
-                        logger.info(
+                        logger.debug(
                             "Status change detected in webhook",
                             from_status=item.get("fromString"),
                             to_status=item.get("toString"),
@@ -163,8 +225,10 @@ def handle_comment_event(webhook_payload: WebhookPayload, sync_engine, source_in
             source_instance=source_instance,
         )
 
-        # Sync the comment
-        return sync_engine.sync_comment_from_webhook(issue_key, comment_id, source_instance, event_type)
+        # Sync the comment; the changelog's new value is the comment text, used to skip echoed sync comments
+        return sync_engine.sync_comment_from_webhook(
+            issue_key, comment_id, source_instance, event_type, comment_body=to_string or None
+        )
 
     except Exception as e:
         logger.error("Error handling comment event", error=str(e))
@@ -174,16 +238,15 @@ def handle_comment_event(webhook_payload: WebhookPayload, sync_engine, source_in
 def jira_webhook_handler(event: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
     """Lambda handler for JIRA webhook events."""
     try:
-        logger.info("Processing JIRA webhook", event_keys=list(event.keys()))
+        logger.debug("Processing JIRA webhook", event_keys=list(event.keys()))
 
         # Extract request details
         headers = event.get("headers", {})
         body = event.get("body", "")
 
         if event.get("isBase64Encoded", False):
-            import base64
-
-            body = base64.b64decode(body).decode("utf-8")
+            # Keep the raw bytes; both the signature check and the payload parser accept them
+            body = base64.b64decode(body)
 
         # Verify webhook signature
         signature = headers.get("x-hub-signature-256") or headers.get("X-Hub-Signature-256")
@@ -191,21 +254,15 @@ def jira_webhook_handler(event: dict[str, Any], context: dict[str, Any]) -> dict
 
         if not verify_webhook_signature(body, signature or "", config.webhook_secret):
             logger.warning("Invalid webhook signature")
-            return {
-                "statusCode": 401,
-                "body": json.dumps({"error": "Invalid signature"}),
-            }
+            return _response(401, {"error": "Invalid signature"})
 
         # Parse webhook payload
         try:
-            webhook_data = json.loads(body)
-            webhook_payload = WebhookPayload(**webhook_data)
+            # Parse and validate in one pass inside pydantic-core, without an intermediate dict
+            webhook_payload = WebhookPayload.model_validate_json(body)
         except Exception as e:
             logger.error("Failed to parse webhook payload", error=str(e))
-            return {
-                "statusCode": 400,
-                "body": json.dumps({"error": "Invalid payload format"}),
-            }
+            return _response(400, {"error": "Invalid payload format"})
 
         # Determine which JIRA instance this webhook is from
         # You'll need to configure this based on your webhook URLs
@@ -213,24 +270,23 @@ def jira_webhook_handler(event: dict[str, Any], context: dict[str, Any]) -> dict
 
         # Filter relevant events
         if not should_process_event(webhook_payload):
-            logger.info(
+            logger.debug(
                 "Skipping event",
                 event_type=webhook_payload.webhookEvent,
                 issue_key=webhook_payload.issue.get("key"),
             )
-            return {
-                "statusCode": 200,
-                "body": json.dumps({"message": "Event skipped"}),
-            }
+            return _response(200, {"message": "Event skipped"})
 
         # Get issue key
         issue_key = webhook_payload.issue.get("key")
         if not issue_key:
             logger.error("No issue key in webhook payload")
-            return {
-                "statusCode": 400,
-                "body": json.dumps({"error": "No issue key found"}),
-            }
+            return _response(400, {"error": "No issue key found"})
+
+        # With a queue configured, the batch handler syncs the event; events queued together for the same
+        # issue then cost a single sync
+        if config.webhook_queue_url and enqueue_webhook(config.webhook_queue_url, body, source_instance):
+            return _response(202, {"message": "Event queued"})
 
         # Process the sync
         sync_engine = get_sync_engine()
@@ -239,18 +295,13 @@ def jira_webhook_handler(event: dict[str, Any], context: dict[str, Any]) -> dict
         if webhook_payload.issue_event_type_name == "issue_commented":
             comment_success = handle_comment_event(webhook_payload, sync_engine, source_instance)
             if comment_success:
-                return {
-                    "statusCode": 200,
-                    "body": json.dumps({"message": "Comment sync completed successfully"}),
-                }
+                return _response(200, {"message": "Comment sync completed successfully"})
             else:
-                return {
-                    "statusCode": 500,
-                    "body": json.dumps({"error": "Comment sync failed"}),
-                }
+                return _response(500, {"error": "Comment sync failed"})
 
-        # Handle regular issue sync
-        result = sync_engine.sync_issue_from_webhook(issue_key, source_instance)
+        # Handle regular issue sync, starting from the issue the webhook carries instead of fetching it
+        source_issue = sync_engine.issue_from_webhook(webhook_payload.issue, source_instance)
+        result = sync_engine.sync_issue_from_webhook(issue_key, source_instance, source_issue)
 
         if result.success:
             logger.info(
@@ -258,37 +309,101 @@ def jira_webhook_handler(event: dict[str, Any], context: dict[str, Any]) -> dict
                 issue_key=issue_key,
                 sync_id=result.sync_record.sync_id,
             )
-            return {
-                "statusCode": 200,
-                "body": json.dumps(
-                    {
-                        "message": "Sync completed successfully",
-                        "sync_id": result.sync_record.sync_id,
-                    }
-                ),
-            }
+            return _response(
+                200,
+                {
+                    "message": "Sync completed successfully",
+                    "sync_id": result.sync_record.sync_id,
+                },
+            )
         else:
             logger.error(
                 "Webhook sync failed",
                 issue_key=issue_key,
                 error=result.error_message,
             )
-            return {
-                "statusCode": 500,
-                "body": json.dumps(
-                    {
-                        "error": "Sync failed",
-                        "message": result.error_message,
-                    }
-                ),
-            }
+            return _response(
+                500,
+                {
+                    "error": "Sync failed",
+                    "message": result.error_message,
+                },
+            )
 
     except Exception as e:
         logger.error("Unexpected error in webhook handler", error=str(e))
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Internal server error"}),
-        }
+        return _response(500, {"error": "Internal server error"})
+
+
+def batch_webhook_handler(event: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
+    """Lambda handler for SQS batches of JIRA webhook events.
+
+    Each message body is a raw webhook payload whose signature was checked before it was queued; the
+    source instance comes from the ``source_instance`` message attribute. Repeated events for the same
+    issue in a batch trigger a single issue sync; those syncs run concurrently on a pool bounded by
+    ``full_sync_workers``, before the batch's comment events. Failed messages are reported through
+    ``batchItemFailures`` so SQS only redelivers those.
+    """
+    sync_engine = get_sync_engine()
+    failed_message_ids: list[str] = []
+    issue_messages: dict[tuple[str, int], list[str]] = {}
+    comment_events: list[tuple[str, WebhookPayload, int]] = []
+
+    for record in event.get("Records", []):
+        message_id = record["messageId"]
+        try:
+            webhook_payload = WebhookPayload.model_validate_json(record["body"])
+        except Exception as e:
+            # Malformed payloads would fail again on redelivery, so they are dropped like a 400
+            logger.error("Failed to parse queued webhook payload", message_id=message_id, error=str(e))
+            continue
+
+        issue_key = webhook_payload.issue.get("key")
+        if not should_process_event(webhook_payload) or not issue_key:
+            continue
+
+        source_instance = _record_source_instance(record)
+        if webhook_payload.issue_event_type_name == "issue_commented":
+            comment_events.append((message_id, webhook_payload, source_instance))
+        else:
+            issue_messages.setdefault((issue_key, source_instance), []).append(message_id)
+
+    logger.info(
+        "Processing webhook batch",
+        records=len(event.get("Records", [])),
+        issues=len(issue_messages),
+        comment_events=len(comment_events),
+    )
+
+    def sync_queued_issue(issue: tuple[str, int]) -> bool:
+        issue_key, source_instance = issue
+        try:
+            return sync_engine.sync_issue_from_webhook(issue_key, source_instance).success
+        except Exception as e:
+            logger.error("Unexpected error syncing queued issue", issue_key=issue_key, error=str(e))
+            return False
+
+    with ThreadPoolExecutor(max_workers=load_config().full_sync_workers, thread_name_prefix="webhook-batch") as pool:
+        outcomes = pool.map(sync_queued_issue, issue_messages)
+        for message_ids, success in zip(issue_messages.values(), outcomes, strict=True):
+            if not success:
+                failed_message_ids.extend(message_ids)
+
+    for message_id, webhook_payload, source_instance in comment_events:
+        if not handle_comment_event(webhook_payload, sync_engine, source_instance):
+            failed_message_ids.append(message_id)
+
+    return {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in failed_message_ids]}
+
+
+def _record_source_instance(record: dict[str, Any]) -> int:
+    """Read the source JIRA instance from an SQS record's message attributes."""
+    attribute = record.get("messageAttributes", {}).get("source_instance", {})
+    try:
+        return int(attribute["stringValue"])
+    except (KeyError, ValueError):
+        logger.warning("Could not determine source instance, defaulting to 1", message_id=record.get("messageId"))
+        return 1
 
 
 def scheduled_sync_handler(event: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
@@ -307,10 +422,7 @@ def scheduled_sync_handler(event: dict[str, Any], context: dict[str, Any]) -> di
             results = sync_engine.retry_failed_syncs()
         else:
             logger.error("Unknown sync type", sync_type=sync_type)
-            return {
-                "statusCode": 400,
-                "body": json.dumps({"error": f"Unknown sync type: {sync_type}"}),
-            }
+            return _response(400, {"error": f"Unknown sync type: {sync_type}"})
 
         # Summarize results
         success_count = sum(1 for r in results if r.success)
@@ -324,26 +436,21 @@ def scheduled_sync_handler(event: dict[str, Any], context: dict[str, Any]) -> di
             failed=failed_count,
         )
 
-        return {
-            "statusCode": 200,
-            "body": json.dumps(
-                {
-                    "message": f"Scheduled sync completed: {sync_type}",
-                    "summary": {
-                        "total": len(results),
-                        "success": success_count,
-                        "failed": failed_count,
-                    },
-                }
-            ),
-        }
+        return _response(
+            200,
+            {
+                "message": f"Scheduled sync completed: {sync_type}",
+                "summary": {
+                    "total": len(results),
+                    "success": success_count,
+                    "failed": failed_count,
+                },
+            },
+        )
 
     except Exception as e:
         logger.error("Error in scheduled sync", error=str(e))
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Scheduled sync failed"}),
-        }
+        return _response(500, {"error": "Scheduled sync failed"})
 
 
 def manual_sync_handler(event: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
@@ -362,53 +469,42 @@ def manual_sync_handler(event: dict[str, Any], context: dict[str, Any]) -> dict[
 
         if resolve_conflict and sync_id and resolution_direction:
             # Manual conflict resolution
-            from .models import SyncDirection
-
             direction = SyncDirection(resolution_direction)
             result = sync_engine.resolve_conflict_manual(sync_id, direction)
 
-            return {
-                "statusCode": 200,
-                "body": json.dumps(
-                    {
-                        "message": "Conflict resolved",
-                        "sync_id": result.sync_record.sync_id,
-                        "success": result.success,
-                    }
-                ),
-            }
+            return _response(
+                200,
+                {
+                    "message": "Conflict resolved",
+                    "sync_id": result.sync_record.sync_id,
+                    "success": result.success,
+                },
+            )
 
         elif issue_key and source_instance:
             # Manual issue sync
             result = sync_engine.sync_issue_from_webhook(issue_key, source_instance)
 
-            return {
-                "statusCode": 200,
-                "body": json.dumps(
-                    {
-                        "message": "Manual sync completed",
-                        "sync_id": result.sync_record.sync_id,
-                        "success": result.success,
-                        "error": result.error_message,
-                    }
-                ),
-            }
+            return _response(
+                200,
+                {
+                    "message": "Manual sync completed",
+                    "sync_id": result.sync_record.sync_id,
+                    "success": result.success,
+                    "error": result.error_message,
+                },
+            )
         else:
-            return {
-                "statusCode": 400,
-                "body": json.dumps(
-                    {
-                        "error": "Invalid parameters. Provide either (issue_key, source_instance) or (sync_id, resolution_direction)",  # noqa: E501
-                    }
-                ),
-            }
+            return _response(
+                400,
+                {
+                    "error": "Invalid parameters. Provide either (issue_key, source_instance) or (sync_id, resolution_direction)",  # noqa: E501
+                },
+            )
 
     except Exception as e:
         logger.error("Error in manual sync", error=str(e))
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Manual sync failed"}),
-        }
+        return _response(500, {"error": "Manual sync failed"})
 
 
 def health_check_handler(event: dict[str, Any], context: dict[str, Any]) -> dict[str, Any]:
@@ -437,36 +533,23 @@ def health_check_handler(event: dict[str, Any], context: dict[str, Any]) -> dict
             },
         }
 
-        return {
-            "statusCode": 200,
-            "body": json.dumps(health_status),
-        }
+        return _response(200, health_status)
 
     except Exception as e:
         logger.error("Health check failed", error=str(e))
-        return {
-            "statusCode": 500,
-            "body": json.dumps(
-                {
-                    "status": "unhealthy",
-                    "error": str(e),
-                }
-            ),
-        }
+        return _response(500, {"status": "unhealthy", "error": str(e)})
 
 
 def determine_source_instance(event: dict[str, Any], config: SyncConfig) -> int:
     """Determine which JIRA instance the webhook is from based on the request."""
     # Method 1: Check the request path or headers
-    path = event.get("path", "")
-    if "/jira1/webhook" in path or "/webhook/jira1" in path:
-        return 1
-    elif "/jira2/webhook" in path or "/webhook/jira2" in path:
-        return 2
+    path_match = _WEBHOOK_PATH_RE.search(event.get("path", ""))
+    if path_match:
+        return int(path_match.group(1) or path_match.group(2))
 
-    # Method 2: Check the request origin
-    headers = event.get("headers", {})
-    origin = headers.get("origin") or headers.get("Origin")
+    # Method 2: Check the request origin (header names are case-insensitive)
+    headers = {name.lower(): value for name, value in (event.get("headers") or {}).items()}
+    origin = headers.get("origin")
     if origin:
         if config.jira_instance_1.base_url in origin:
             return 1
@@ -474,7 +557,7 @@ def determine_source_instance(event: dict[str, Any], config: SyncConfig) -> int:
             return 2
 
     # Method 3: Check custom header (you can configure this in JIRA webhook)
-    jira_instance_header = headers.get("x-jira-instance") or headers.get("X-Jira-Instance")
+    jira_instance_header = headers.get("x-jira-instance")
     if jira_instance_header:
         try:
             return int(jira_instance_header)
@@ -484,3 +567,8 @@ def determine_source_instance(event: dict[str, Any], config: SyncConfig) -> int:
     # Default to instance 1 (you might want to raise an error instead)
     logger.warning("Could not determine source instance, defaulting to 1")
     return 1
+
+
+# Only inside the Lambda runtime; local imports and scripts don't need config or AWS access
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    _warm_start()
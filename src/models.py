@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SyncDirection(str, Enum):
@@ -27,6 +27,9 @@ class SyncStatus(str, Enum):
 class JiraComment(BaseModel):
     """Standardized JIRA comment representation."""
 
+    # Parsed snapshots of JIRA state; never modified after parsing
+    model_config = ConfigDict(frozen=True)
+
     id: str
     body: str
     author_name: str
@@ -41,6 +44,9 @@ class JiraComment(BaseModel):
 class JiraIssue(BaseModel):
     """Standardized JIRA issue representation."""
 
+    # Parsed snapshots of JIRA state; frozen so content_hash always matches the fields
+    model_config = ConfigDict(frozen=True)
+
     key: str
     summary: str
     description: str | None = None
@@ -57,6 +63,11 @@ class JiraIssue(BaseModel):
     updated: datetime
     resolution: str | None = None
     comments: list[JiraComment] = Field(default_factory=list)
+    content_hash: bytes | None = Field(
+        default=None,
+        exclude=True,
+        description="Digest of the synced fields (status excluded) for quick equality checks",
+    )
 
 
 class SyncRecord(BaseModel):
@@ -86,6 +97,9 @@ class SyncRecord(BaseModel):
     requires_manual_resolution: bool = Field(default=False)
     conflict_details: str | None = None
 
+    # Optimistic locking: the version this copy was read at; bumped by every save
+    version: int = Field(default=0)
+
 
 class WebhookPayload(BaseModel):
     """JIRA webhook payload."""
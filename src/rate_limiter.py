@@ -0,0 +1,65 @@
+"""Client-side rate limiting for outbound API requests."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket with additive-increase/multiplicative-decrease rate control.
+
+    The refill rate starts at ``max_rate``, is halved whenever the server signals throttling
+    and creeps back up by ``increase_step`` after each successful request.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        capacity: float | None = None,
+        min_rate: float = 0.5,
+        increase_step: float = 0.1,
+    ) -> None:
+        """Initialize token bucket."""
+        self.max_rate = max_rate
+        self._configured_max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase_step = increase_step
+        self.rate = max_rate
+        self.capacity = capacity if capacity is not None else max_rate
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+    def set_max_rate(self, rate: float) -> None:
+        """Adopt a server-advertised rate as the ceiling, never above the configured maximum."""
+        with self._lock:
+            self._refill()
+            self.max_rate = max(self.min_rate, min(self._configured_max_rate, rate))
+            self.rate = min(self.rate, self.max_rate)
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttled(self) -> None:
+        """Multiplicatively decrease the rate after the server throttled a request."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * 0.5)
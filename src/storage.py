@@ -1,11 +1,18 @@
 """DynamoDB storage operations for sync state management."""
 
-from datetime import datetime
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import boto3
 import structlog
-from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from .config import DynamoDBConfig
@@ -13,6 +20,143 @@ from .models import CommentSyncRecord, SyncDirection, SyncRecord, SyncStatus
 
 logger = structlog.get_logger()
 
+# DynamoDB's BatchGetItem and BatchWriteItem limits on keys/items per request
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _encode_timestamp(value: datetime) -> int:
+    """Store a timestamp as integer microseconds since the Unix epoch (a DynamoDB Number)."""
+    if value.tzinfo is None:
+        # Naive datetimes in this codebase are UTC
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_timestamp(value: dict[str, str]) -> datetime:
+    """Read a stored timestamp: epoch microseconds, or an ISO-8601 string written by older versions."""
+    if "N" in value:
+        return _EPOCH + int(value["N"]) * _MICROSECOND
+    return _decode_legacy_timestamp(value["S"])
+
+
+# Legacy timestamps repeat heavily across records (e.g. a batch synced together); datetimes are immutable,
+# so decoded values can be shared
+@lru_cache(maxsize=4096)
+def _decode_legacy_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp written before timestamps were stored as numbers."""
+    return datetime.fromisoformat(value)
+
+
+# Enough pooled connections for parallel scans and batch writers, keep-alive on idle sockets, and
+# adaptive client-side rate limiting when DynamoDB throttles
+BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+
+@lru_cache(maxsize=1)
+def _boto_session() -> boto3.session.Session:
+    """Session shared by every storage instance, so credentials are resolved once per process."""
+    return boto3.session.Session()
+
+
+@lru_cache(maxsize=4)
+def _dynamodb_client(region: str) -> Any:
+    """Low-level DynamoDB client per region, shared so every storage instance reuses one connection pool.
+
+    The client (unlike the resource layer) is thread-safe, and skips boto3's generic TypeSerializer /
+    TypeDeserializer walk: items are converted to and from AttributeValues by the record codecs below.
+    """
+    return _boto_session().client("dynamodb", region_name=region, config=BOTO_CONFIG)
+
+
+# Attributes _item_to_sync_record cannot do without; always part of a projected scan
+REQUIRED_RECORD_ATTRIBUTES = ("sync_id", "status", "last_sync_timestamp", "version")
+
+# GSI name and key attribute per JIRA instance
+_JIRA_KEY_INDEXES = {1: ("jira-1-key-index", "jira_1_key"), 2: ("jira-2-key-index", "jira_2_key")}
+
+# Tables confirmed to exist by this process; skips DescribeTable on later initialisations
+_VERIFIED_TABLES: set[str] = set()
+
+# Threads in each storage instance's pool for overlapping independent DynamoDB calls; well under the
+# connection pool size so concurrent callers do not queue for connections
+STORAGE_WORKERS = 16
+
+# Upper bound on sync records kept in each in-process cache
+RECORD_CACHE_SIZE = 4096
+
+# Plain dict lookups are much cheaper than Enum.__call__ on the hydration path
+_STATUS_BY_VALUE = {status.value: status for status in SyncStatus}
+_DIRECTION_BY_VALUE = {direction.value: direction for direction in SyncDirection}
+
+
+def _string_value(value: str) -> dict[str, str]:
+    """Encode a string attribute."""
+    return {"S": value}
+
+
+def _enum_value(value: SyncStatus | SyncDirection) -> dict[str, str]:
+    """Encode a string-valued enum attribute."""
+    return {"S": value.value}
+
+
+def _timestamp_value(value: datetime) -> dict[str, str]:
+    """Encode a timestamp attribute as epoch microseconds."""
+    return {"N": str(_encode_timestamp(value))}
+
+
+# Optional SyncRecord attributes and their AttributeValue encoders; unset (falsy) values are not stored
+_OPTIONAL_RECORD_ATTRIBUTES = (
+    ("jira_1_key", _string_value),
+    ("jira_2_key", _string_value),
+    ("last_sync_direction", _enum_value),
+    ("jira_1_last_updated", _timestamp_value),
+    ("jira_2_last_updated", _timestamp_value),
+    ("last_error", _string_value),
+    ("conflict_details", _string_value),
+)
+
+
+def _projection_kwargs(attributes: list[str] | None) -> dict[str, Any]:
+    """Build ProjectionExpression kwargs for a record read, aliasing names to avoid reserved words.
+
+    The attributes every record needs are always included; None reads everything.
+    """
+    if attributes is None:
+        return {}
+    names = list(dict.fromkeys([*REQUIRED_RECORD_ATTRIBUTES, *attributes]))
+    return {
+        "ProjectionExpression": ", ".join(f"#a{i}" for i in range(len(names))),
+        "ExpressionAttributeNames": {f"#a{i}": name for i, name in enumerate(names)},
+    }
+
+
+def _index_query_kwargs(
+    table_name: str, index_name: str, key_attr: str, value: str, attributes: list[str] | None = None
+) -> dict[str, Any]:
+    """Build Query kwargs for an equality lookup on a string-keyed GSI, optionally projected."""
+    projection = _projection_kwargs(attributes)
+    return {
+        "TableName": table_name,
+        "IndexName": index_name,
+        "KeyConditionExpression": "#k = :k",
+        **projection,
+        "ExpressionAttributeNames": {"#k": key_attr, **projection.get("ExpressionAttributeNames", {})},
+        "ExpressionAttributeValues": {":k": {"S": value}},
+    }
+
+
+def _sync_id_key(sync_id: str) -> dict[str, Any]:
+    """Primary key of an item, as an AttributeValue map."""
+    return {"sync_id": {"S": sync_id}}
+
 
 class StorageError(Exception):
     """Custom exception for storage operations."""
@@ -20,6 +164,12 @@ class StorageError(Exception):
     pass
 
 
+class StorageConflictError(StorageError):
+    """A sync record was changed by another writer since it was read."""
+
+    pass
+
+
 class DynamoDBStorage:
     """DynamoDB storage for sync state management."""
 
@@ -27,21 +177,39 @@ class DynamoDBStorage:
         """Initialize DynamoDB storage."""
         self.config = config
         self.table_name = config.table_name
+        # Short-lived caches: sync_id -> (cached_at, record) and (instance, jira_key) -> (cached_at, sync_id)
+        self._record_cache: dict[str, tuple[float, SyncRecord]] = {}
+        self._jira_key_cache: dict[tuple[int, str], tuple[float, str]] = {}
+        # Comment sync records by sync_id; looked up once per comment event to detect loops and updates
+        self._comment_cache: dict[str, tuple[float, CommentSyncRecord]] = {}
+        # Guards all three caches, which the sync thread pools share through one storage instance
+        self._cache_lock = threading.Lock()
+        # Long-lived pool for fanning out independent calls on the thread-safe client (threads start lazily)
+        self._executor = ThreadPoolExecutor(max_workers=STORAGE_WORKERS, thread_name_prefix="dynamodb-storage")
 
         try:
-            self.dynamodb = boto3.resource("dynamodb", region_name=config.region)
-            self.table = self.dynamodb.Table(self.table_name)
+            self.client = _dynamodb_client(config.region)
         except NoCredentialsError as e:
             raise StorageError(f"AWS credentials not found: {e}") from e
         except Exception as e:
             raise StorageError(f"Failed to initialize DynamoDB: {e}") from e
 
     def create_table_if_not_exists(self) -> None:
-        """Create DynamoDB table if it doesn't exist."""
+        """Create DynamoDB table if it doesn't exist.
+
+        Once the table is known to exist it is remembered for the process, and via a marker file in the
+        temp directory for other processes on the same host (e.g. later Lambda runtimes in a container).
+        """
+        marker = self._table_marker_path()
+        if self.table_name in _VERIFIED_TABLES or marker.exists():
+            _VERIFIED_TABLES.add(self.table_name)
+            return
+
         try:
             # Check if table exists
-            self.table.load()
+            self.client.describe_table(TableName=self.table_name)
             logger.info("DynamoDB table already exists", table_name=self.table_name)
+            self._mark_table_verified(marker)
             return
         except ClientError as e:
             if e.response["Error"]["Code"] != "ResourceNotFoundException":
@@ -51,7 +219,7 @@ class DynamoDBStorage:
         try:
             logger.info("Creating DynamoDB table", table_name=self.table_name)
 
-            table = self.dynamodb.create_table(
+            self.client.create_table(
                 TableName=self.table_name,
                 KeySchema=[
                     {"AttributeName": "sync_id", "KeyType": "HASH"},  # Partition key
@@ -61,6 +229,7 @@ class DynamoDBStorage:
                     {"AttributeName": "jira_1_key", "AttributeType": "S"},
                     {"AttributeName": "jira_2_key", "AttributeType": "S"},
                     {"AttributeName": "status", "AttributeType": "S"},
+                    {"AttributeName": "needs_resolution", "AttributeType": "N"},
                 ],
                 GlobalSecondaryIndexes=[
                     {
@@ -87,6 +256,15 @@ class DynamoDBStorage:
                         "Projection": {"ProjectionType": "ALL"},
                         "BillingMode": "PAY_PER_REQUEST",
                     },
+                    {
+                        # Sparse index: only records awaiting manual resolution carry the key
+                        "IndexName": "conflicts-index",
+                        "KeySchema": [
+                            {"AttributeName": "needs_resolution", "KeyType": "HASH"},
+                        ],
+                        "Projection": {"ProjectionType": "ALL"},
+                        "BillingMode": "PAY_PER_REQUEST",
+                    },
                 ],
                 BillingMode="PAY_PER_REQUEST",
                 Tags=[
@@ -96,73 +274,318 @@ class DynamoDBStorage:
             )
 
             # Wait for table to be created
-            table.wait_until_exists()
+            self.client.get_waiter("table_exists").wait(TableName=self.table_name)
             logger.info("DynamoDB table created successfully", table_name=self.table_name)
+            self._mark_table_verified(marker)
 
         except ClientError as e:
             raise StorageError(f"Failed to create DynamoDB table: {e}") from e
 
-    def save_sync_record(self, record: SyncRecord) -> None:
-        """Save sync record to DynamoDB."""
+    def _table_marker_path(self) -> Path:
+        """Marker file recording that this region's table has been verified."""
+        return Path(tempfile.gettempdir()) / f".dynamodb_verified_{self.config.region}_{self.table_name}"
+
+    def _mark_table_verified(self, marker: Path) -> None:
+        """Remember that the table exists, in-process and on disk (best effort)."""
+        _VERIFIED_TABLES.add(self.table_name)
+        try:
+            marker.touch()
+        except OSError as e:
+            logger.debug("Could not write table marker", path=str(marker), error=str(e))
+
+    def save_sync_record(self, record: SyncRecord, create: bool = False) -> None:
+        """Save sync record to DynamoDB.
+
+        The write only succeeds if the stored version still matches ``record.version``; on success the
+        version is bumped on ``record`` too, so the same object can be saved again. StorageConflictError is
+        raised if another writer saved the record since it was read. A save identical to the record this
+        process last read or wrote (within the cache TTL) is skipped. With ``create=True`` the write only
+        succeeds if no record with this sync_id exists yet, so only the first of several creators wins.
+        """
+        if not create and self._cache_get(self._record_cache, record.sync_id) == record:
+            logger.debug("Sync record unchanged, skipping write", sync_id=record.sync_id)
+            return
+
+        if create:
+            condition: dict[str, Any] = {"ConditionExpression": "attribute_not_exists(sync_id)"}
+        else:
+            condition = {
+                # Items written before versioning have no version attribute yet
+                "ConditionExpression": "attribute_not_exists(#v) OR #v = :v",
+                "ExpressionAttributeNames": {"#v": "version"},
+                "ExpressionAttributeValues": {":v": {"N": str(record.version)}},
+            }
+
         try:
             item = self._sync_record_to_item(record)
 
-            logger.info(
+            logger.debug(
                 "Saving sync record",
                 sync_id=record.sync_id,
                 status=record.status,
             )
 
-            self.table.put_item(Item=item)
+            self.client.put_item(
+                TableName=self.table_name,
+                Item=item,
+                **condition,
+                # A failed check returns the stored item, which the caller's retry then reads from the cache
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
+            record.version += 1
+            self._cache_record(record)
 
         except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                # Our copy is stale; replace it with the stored item, or drop it so the next read goes to DynamoDB
+                if "Item" in e.response:
+                    self._cache_record(self._item_to_sync_record(e.response["Item"]))
+                else:
+                    with self._cache_lock:
+                        self._record_cache.pop(record.sync_id, None)
+                error_msg = f"Sync record {record.sync_id} was modified concurrently (version {record.version})"
+                logger.warning("Sync record version conflict", sync_id=record.sync_id, version=record.version)
+                raise StorageConflictError(error_msg) from e
+
             error_msg = f"Failed to save sync record {record.sync_id}: {e}"
             logger.error("Error saving sync record", error=error_msg)
             raise StorageError(error_msg) from e
 
     def get_sync_record(self, sync_id: str) -> SyncRecord | None:
-        """Get sync record by sync_id."""
+        """Get sync record by sync_id.
+
+        Served from the in-process cache while fresh. The cache is shared by every thread using this
+        storage instance; concurrent misses on the same sync_id are not coalesced, each reads DynamoDB.
+        """
+        cached = self._cached_record(sync_id)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.table.get_item(Key={"sync_id": sync_id})
+            response = self.client.get_item(TableName=self.table_name, Key=_sync_id_key(sync_id))
 
             if "Item" not in response:
                 return None
 
-            return self._item_to_sync_record(response["Item"])
+            record = self._item_to_sync_record(response["Item"])
+            self._cache_record(record)
+            return record
 
         except ClientError as e:
             error_msg = f"Failed to get sync record {sync_id}: {e}"
             logger.error("Error getting sync record", error=error_msg)
             raise StorageError(error_msg) from e
 
+    def _cache_get(self, cache: dict[Any, tuple[float, Any]], key: Any) -> Any | None:
+        """Return a cached value if it is still within the TTL; safe to call from any thread."""
+        with self._cache_lock:
+            entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.config.record_cache_ttl_seconds:
+            return entry[1]
+        return None
+
+    def _cached_record(self, sync_id: str) -> SyncRecord | None:
+        """Return a copy of a cached record; callers mutate the records they get back."""
+        record = self._cache_get(self._record_cache, sync_id)
+        return record.model_copy(deep=True) if record is not None else None
+
+    def _cache_record(self, record: SyncRecord) -> None:
+        """Remember a record just read or written, under its sync_id and both JIRA keys."""
+        if self.config.record_cache_ttl_seconds <= 0:
+            return
+
+        copy = record.model_copy(deep=True)
+        with self._cache_lock:
+            now = time.monotonic()
+            self._record_cache[record.sync_id] = (now, copy)
+            for instance, jira_key in ((1, record.jira_1_key), (2, record.jira_2_key)):
+                if jira_key:
+                    self._jira_key_cache[(instance, jira_key)] = (now, record.sync_id)
+
+            for cache in (self._record_cache, self._jira_key_cache):
+                self._evict_oldest(cache)
+
+    def _cache_comment_record(self, record: CommentSyncRecord) -> None:
+        """Remember a comment sync record just read or written."""
+        if self.config.record_cache_ttl_seconds <= 0:
+            return
+
+        copy = record.model_copy()
+        with self._cache_lock:
+            self._comment_cache[record.sync_id] = (time.monotonic(), copy)
+            self._evict_oldest(self._comment_cache)
+
+    def _evict_oldest(self, cache: dict[Any, tuple[float, Any]]) -> None:
+        """Evict the oldest entries (dicts keep insertion order) once a cache is over the bound.
+
+        Callers hold _cache_lock, so no other thread inserts while the oldest key is read.
+        """
+        while len(cache) > RECORD_CACHE_SIZE:
+            del cache[next(iter(cache))]
+
+    def save_sync_records_bulk(self, records: Iterable[SyncRecord]) -> None:
+        """Save many sync records using batched writes (25 items per request).
+
+        ``records`` may be any iterable, including a generator; items are streamed into the writer.
+        BatchWriteItem cannot carry conditions, so versions are bumped without the check save_sync_record
+        makes.
+        """
+        count = 0
+        try:
+            # Keyed by sync_id: later records win if the same sync_id appears twice in one batch
+            pending: dict[str, dict[str, Any]] = {}
+            for record in records:
+                pending[record.sync_id] = {"PutRequest": {"Item": self._sync_record_to_item(record)}}
+                record.version += 1
+                self._cache_record(record)
+                count += 1
+                if len(pending) == BATCH_WRITE_LIMIT:
+                    self._batch_write(list(pending.values()))
+                    pending.clear()
+            if pending:
+                self._batch_write(list(pending.values()))
+
+            logger.info("Saved sync records in bulk", count=count)
+
+        except ClientError as e:
+            error_msg = f"Failed to save sync records after {count} queued: {e}"
+            logger.error("Error saving sync records in bulk", error=error_msg)
+            raise StorageError(error_msg) from e
+
+    def _batch_write(self, write_requests: list[dict[str, Any]]) -> None:
+        """Send one BatchWriteItem, re-sending throttled items with backoff until all are written."""
+        request_items = {self.table_name: write_requests}
+        attempt = 0
+        while request_items:
+            response = self.client.batch_write_item(RequestItems=request_items)
+            request_items = response.get("UnprocessedItems") or {}
+            if request_items:
+                time.sleep(min(2**attempt * 0.05, 2.0))
+                attempt += 1
+
+    def get_sync_records_bulk(self, sync_ids: list[str]) -> dict[str, SyncRecord]:
+        """Get many sync records using BatchGetItem (100 keys per request), keyed by sync_id.
+
+        Missing records are simply absent from the result. Records still in the read-through cache are
+        served from it, and fetched records are added to it.
+        """
+        records: dict[str, SyncRecord] = {}
+        unique_ids = []
+        for sync_id in dict.fromkeys(sync_ids):
+            cached = self._cached_record(sync_id)
+            if cached is not None:
+                records[sync_id] = cached
+            else:
+                unique_ids.append(sync_id)
+
+        try:
+            chunks = [
+                unique_ids[start : start + BATCH_GET_LIMIT] for start in range(0, len(unique_ids), BATCH_GET_LIMIT)
+            ]
+            if len(chunks) > 1:
+                # Overlap the round trips; hydration and caching stay on this thread
+                item_lists = list(self._executor.map(self._batch_get, chunks))
+            else:
+                item_lists = [self._batch_get(chunk) for chunk in chunks]
+
+            for items in item_lists:
+                for item in items:
+                    record = self._item_to_sync_record(item)
+                    records[record.sync_id] = record
+                    self._cache_record(record)
+
+            return records
+
+        except ClientError as e:
+            error_msg = f"Failed to get {len(unique_ids)} sync records: {e}"
+            logger.error("Error getting sync records in bulk", error=error_msg)
+            raise StorageError(error_msg) from e
+
+    def _batch_get(self, sync_ids: list[str]) -> list[dict[str, Any]]:
+        """Fetch up to BATCH_GET_LIMIT items, re-requesting throttled keys with backoff."""
+        items: list[dict[str, Any]] = []
+        request_items = {self.table_name: {"Keys": [_sync_id_key(sync_id) for sync_id in sync_ids]}}
+        attempt = 0
+        while request_items:
+            response = self.client.batch_get_item(RequestItems=request_items)
+            items.extend(response["Responses"].get(self.table_name, []))
+
+            # Throttled keys come back unprocessed; back off before re-requesting them
+            request_items = response.get("UnprocessedKeys") or {}
+            if request_items:
+                time.sleep(min(2**attempt * 0.05, 2.0))
+                attempt += 1
+        return items
+
     def save_comment_sync_record(self, record: CommentSyncRecord) -> None:
         """Save comment sync record to DynamoDB."""
         try:
             item = self._comment_sync_record_to_item(record)
 
-            logger.info(
+            logger.debug(
                 "Saving comment sync record",
                 sync_id=record.sync_id,
                 issue_key=record.issue_key,
                 comment_id=record.source_comment_id,
             )
 
-            self.table.put_item(Item=item)
+            self.client.put_item(TableName=self.table_name, Item=item)
+            self._cache_comment_record(record)
 
         except ClientError as e:
             error_msg = f"Failed to save comment sync record {record.sync_id}: {e}"
             logger.error("Error saving comment sync record", error=error_msg)
             raise StorageError(error_msg) from e
 
+    def claim_comment_sync(self, record: CommentSyncRecord) -> bool:
+        """Write a comment sync record only if none exists yet; returns False if one already did.
+
+        A single conditional write, so two workers handling the same comment cannot both claim it.
+        """
+        try:
+            self.client.put_item(
+                TableName=self.table_name,
+                Item=self._comment_sync_record_to_item(record),
+                ConditionExpression="attribute_not_exists(sync_id)",
+            )
+            self._cache_comment_record(record)
+            return True
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            error_msg = f"Failed to claim comment sync {record.sync_id}: {e}"
+            logger.error("Error claiming comment sync", error=error_msg)
+            raise StorageError(error_msg) from e
+
+    def delete_comment_sync_record(self, sync_id: str) -> None:
+        """Delete comment sync record from DynamoDB."""
+        try:
+            self.client.delete_item(TableName=self.table_name, Key=_sync_id_key(sync_id))
+            with self._cache_lock:
+                self._comment_cache.pop(sync_id, None)
+
+        except ClientError as e:
+            error_msg = f"Failed to delete comment sync record {sync_id}: {e}"
+            logger.error("Error deleting comment sync record", error=error_msg)
+            raise StorageError(error_msg) from e
+
     def get_comment_sync_record(self, sync_id: str) -> CommentSyncRecord | None:
-        """Get comment sync record by sync_id."""
+        """Get comment sync record by sync_id, served from the cache while fresh."""
+        cached = self._cache_get(self._comment_cache, sync_id)
+        if cached is not None:
+            # Callers update and re-save the records they get back
+            return cached.model_copy()
+
         try:
-            response = self.table.get_item(Key={"sync_id": sync_id})
+            response = self.client.get_item(TableName=self.table_name, Key=_sync_id_key(sync_id))
 
             if "Item" not in response:
                 return None
 
-            return self._item_to_comment_sync_record(response["Item"])
+            record = self._item_to_comment_sync_record(response["Item"])
+            self._cache_comment_record(record)
+            return record
 
         except ClientError as e:
             error_msg = f"Failed to get comment sync record {sync_id}: {e}"
@@ -170,10 +593,10 @@ class DynamoDBStorage:
             raise StorageError(error_msg) from e
 
     def find_comment_sync_by_source(
-        self, issue_key: str, source_comment_id: str, source_instance: int
+        self, issue_key: str, source_comment_id: str, target_instance: int
     ) -> CommentSyncRecord | None:
-        """Find comment sync record by source comment."""
-        sync_id = self._generate_comment_sync_id(issue_key, source_comment_id, source_instance)
+        """Find comment sync record by source comment (a GetItem on its composite sync_id)."""
+        sync_id = self._generate_comment_sync_id(issue_key, source_comment_id, target_instance)
         return self.get_comment_sync_record(sync_id)
 
     def _generate_comment_sync_id(self, issue_key: str, comment_id: str, target_instance: int) -> str:
@@ -181,35 +604,39 @@ class DynamoDBStorage:
         return f"{issue_key}#{comment_id}#{target_instance}"
 
     def _comment_sync_record_to_item(self, record: CommentSyncRecord) -> dict[str, Any]:
-        """Convert CommentSyncRecord to DynamoDB item."""
+        """Convert CommentSyncRecord to a DynamoDB item (AttributeValue map)."""
         item = {
-            "sync_id": record.sync_id,
-            "issue_key": record.issue_key,
-            "source_comment_id": record.source_comment_id,
-            "source_instance": record.source_instance,
-            "target_instance": record.target_instance,
-            "last_sync_timestamp": record.last_sync_timestamp.isoformat(),
-            "sync_direction": record.sync_direction.value,
-            "status": record.status.value,
+            "sync_id": {"S": record.sync_id},
+            "issue_key": {"S": record.issue_key},
+            "source_comment_id": {"S": record.source_comment_id},
+            "source_instance": {"N": str(record.source_instance)},
+            "target_instance": {"N": str(record.target_instance)},
+            "last_sync_timestamp": {"N": str(_encode_timestamp(record.last_sync_timestamp))},
+            "sync_direction": {"S": record.sync_direction.value},
+            "status": {"S": record.status.value},
         }
 
         if record.target_comment_id:
-            item["target_comment_id"] = record.target_comment_id
+            item["target_comment_id"] = {"S": record.target_comment_id}
 
         return item
 
     def _item_to_comment_sync_record(self, item: dict[str, Any]) -> CommentSyncRecord:
-        """Convert DynamoDB item to CommentSyncRecord."""
-        return CommentSyncRecord(
-            sync_id=item["sync_id"],
-            issue_key=item["issue_key"],
-            source_comment_id=item["source_comment_id"],
-            target_comment_id=item.get("target_comment_id"),
-            source_instance=item["source_instance"],
-            target_instance=item["target_instance"],
-            last_sync_timestamp=datetime.fromisoformat(item["last_sync_timestamp"]),
-            sync_direction=SyncDirection(item["sync_direction"]),
-            status=SyncStatus(item["status"]),
+        """Convert a DynamoDB item (AttributeValue map) to CommentSyncRecord.
+
+        Items are written by _comment_sync_record_to_item, so validation is skipped.
+        """
+        target_comment_id = item.get("target_comment_id")
+        return CommentSyncRecord.model_construct(
+            sync_id=item["sync_id"]["S"],
+            issue_key=item["issue_key"]["S"],
+            source_comment_id=item["source_comment_id"]["S"],
+            target_comment_id=target_comment_id["S"] if target_comment_id else None,
+            source_instance=int(item["source_instance"]["N"]),
+            target_instance=int(item["target_instance"]["N"]),
+            last_sync_timestamp=_decode_timestamp(item["last_sync_timestamp"]),
+            sync_direction=_DIRECTION_BY_VALUE[item["sync_direction"]["S"]],
+            status=_STATUS_BY_VALUE[item["status"]["S"]],
         )
 
     def find_sync_record_by_jira_key(
@@ -221,35 +648,67 @@ class DynamoDBStorage:
         if jira_instance not in (1, 2):
             raise ValueError("jira_instance must be 1 or 2")
 
+        cached_id = self._cache_get(self._jira_key_cache, (jira_instance, jira_key))
+        if cached_id is not None:
+            cached = self._cached_record(cached_id)
+            if cached is not None:
+                return cached
+
         try:
-            index_name = f"jira-{jira_instance}-key-index"
-            key_attr = f"jira_{jira_instance}_key"
+            index_name, key_attr = _JIRA_KEY_INDEXES[jira_instance]
 
-            response = self.table.query(
-                IndexName=index_name,
-                KeyConditionExpression=Key(key_attr).eq(jira_key),
+            # Only the first match is used (keys should be unique), so read no more than one item
+            response = self.client.query(
+                **_index_query_kwargs(self.table_name, index_name, key_attr, jira_key), Limit=1
             )
 
             if not response["Items"]:
                 return None
 
             # Return the first match (should be unique)
-            return self._item_to_sync_record(response["Items"][0])
+            record = self._item_to_sync_record(response["Items"][0])
+            self._cache_record(record)
+            return record
 
         except ClientError as e:
             error_msg = f"Failed to find sync record by {key_attr}={jira_key}: {e}"
             logger.error("Error finding sync record", error=error_msg)
             raise StorageError(error_msg) from e
 
-    def get_records_by_status(self, status: SyncStatus) -> list[SyncRecord]:
-        """Get all sync records with a specific status."""
+    def prefetch_sync_record_by_jira_key(self, jira_key: str, jira_instance: int) -> Future[SyncRecord | None]:
+        """Start find_sync_record_by_jira_key in the background so the caller can overlap other I/O with it."""
+        return self._executor.submit(self.find_sync_record_by_jira_key, jira_key, jira_instance)
+
+    def find_sync_records_by_jira_keys(
+        self, jira_1_key: str | None, jira_2_key: str | None
+    ) -> tuple[SyncRecord | None, SyncRecord | None]:
+        """Look up sync records by a JIRA 1 key and a JIRA 2 key concurrently.
+
+        Returns the (by jira_1_key, by jira_2_key) matches; a key given as None is not looked up.
+        """
+        lookups = [
+            self._executor.submit(self.find_sync_record_by_jira_key, jira_key, instance) if jira_key else None
+            for instance, jira_key in ((1, jira_1_key), (2, jira_2_key))
+        ]
+        by_jira_1, by_jira_2 = (lookup.result() if lookup else None for lookup in lookups)
+        return by_jira_1, by_jira_2
+
+    def get_records_by_status(self, status: SyncStatus, attributes: list[str] | None = None) -> list[SyncRecord]:
+        """Get all sync records with a specific status.
+
+        ``attributes`` restricts the attributes read, as for get_all_sync_records.
+        """
         try:
-            response = self.table.query(
-                IndexName="status-index",
-                KeyConditionExpression=Key("status").eq(status.value),
-            )
+            query_kwargs = _index_query_kwargs(self.table_name, "status-index", "status", status.value, attributes)
+            response = self.client.query(**query_kwargs)
+            records = [self._item_to_sync_record(item) for item in response["Items"]]
+
+            # Handle pagination if needed
+            while "LastEvaluatedKey" in response:
+                response = self.client.query(**query_kwargs, ExclusiveStartKey=response["LastEvaluatedKey"])
+                records.extend(self._item_to_sync_record(item) for item in response["Items"])
 
-            return [self._item_to_sync_record(item) for item in response["Items"]]
+            return records
 
         except ClientError as e:
             error_msg = f"Failed to get records by status {status}: {e}"
@@ -261,85 +720,129 @@ class DynamoDBStorage:
         try:
             logger.info("Deleting sync record", sync_id=sync_id)
 
-            self.table.delete_item(Key={"sync_id": sync_id})
+            self.client.delete_item(TableName=self.table_name, Key=_sync_id_key(sync_id))
+            # Key entries pointing at this sync_id become misses once the record is gone
+            with self._cache_lock:
+                self._record_cache.pop(sync_id, None)
 
         except ClientError as e:
             error_msg = f"Failed to delete sync record {sync_id}: {e}"
             logger.error("Error deleting sync record", error=error_msg)
             raise StorageError(error_msg) from e
 
-    def get_all_sync_records(self, limit: int | None = None) -> list[SyncRecord]:
-        """Get all sync records with optional limit."""
+    def get_all_sync_records(
+        self,
+        limit: int | None = None,
+        segments: int = 4,
+        attributes: list[str] | None = None,
+    ) -> list[SyncRecord]:
+        """Get all sync records with optional limit.
+
+        The table is read with a parallel scan over ``segments`` segments (capped at the storage pool
+        size); with a limit, every segment stops as soon as enough records have been collected.
+        ``attributes`` restricts the attributes read (the ones every record needs are always included);
+        unread optional fields come back as their defaults.
+        """
         try:
-            scan_kwargs = {}
+            scan_kwargs: dict[str, Any] = {"TableName": self.table_name}
             if limit:
+                # No page needs to be larger than the whole result
                 scan_kwargs["Limit"] = limit
-
-            response = self.table.scan(**scan_kwargs)
-
-            records = [self._item_to_sync_record(item) for item in response["Items"]]
-
-            # Handle pagination if needed
-            while "LastEvaluatedKey" in response and (not limit or len(records) < limit):
-                scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-                if limit:
-                    scan_kwargs["Limit"] = limit - len(records)
-
-                response = self.table.scan(**scan_kwargs)
-                records.extend([self._item_to_sync_record(item) for item in response["Items"]])
-
-            return records
+            scan_kwargs.update(_projection_kwargs(attributes))
+
+            segments = max(1, min(segments, STORAGE_WORKERS))
+            records: list[SyncRecord] = []
+            lock = threading.Lock()
+            enough = threading.Event()
+
+            def scan(segment: int) -> None:
+                segment_kwargs = scan_kwargs
+                if segments > 1:
+                    segment_kwargs = {**scan_kwargs, "Segment": segment, "TotalSegments": segments}
+                for page in self._iter_scan_pages(segment_kwargs):
+                    with lock:
+                        records.extend(page)
+                        if limit and len(records) >= limit:
+                            enough.set()
+                    if enough.is_set():
+                        return
+
+            if segments == 1:
+                scan(0)
+            else:
+                # list() re-raises any worker's exception here
+                list(self._executor.map(scan, range(segments)))
+
+            return records[:limit] if limit else records
 
         except ClientError as e:
             error_msg = f"Failed to get all sync records: {e}"
             logger.error("Error getting all sync records", error=error_msg)
             raise StorageError(error_msg) from e
 
+    def _iter_scan_pages(self, scan_kwargs: dict[str, Any]) -> Iterator[list[SyncRecord]]:
+        """Scan one table segment (or the whole table), yielding each page of records."""
+        scan_kwargs = dict(scan_kwargs)
+        while True:
+            response = self.client.scan(**scan_kwargs)
+            yield [self._item_to_sync_record(item) for item in response["Items"]]
+
+            # Handle pagination if needed
+            if "LastEvaluatedKey" not in response:
+                return
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
     def _sync_record_to_item(self, record: SyncRecord) -> dict[str, Any]:
-        """Convert SyncRecord to DynamoDB item."""
+        """Convert SyncRecord to a DynamoDB item (AttributeValue map)."""
         item = {
-            "sync_id": record.sync_id,
-            "status": record.status.value,
-            "last_sync_timestamp": record.last_sync_timestamp.isoformat(),
-            "error_count": record.error_count,
-            "requires_manual_resolution": record.requires_manual_resolution,
+            "sync_id": {"S": record.sync_id},
+            "status": {"S": record.status.value},
+            "last_sync_timestamp": {"N": str(_encode_timestamp(record.last_sync_timestamp))},
+            "error_count": {"N": str(record.error_count)},
+            "requires_manual_resolution": {"BOOL": record.requires_manual_resolution},
+            "version": {"N": str(record.version + 1)},
         }
 
-        # Optional fields
-        if record.jira_1_key:
-            item["jira_1_key"] = record.jira_1_key
-        if record.jira_2_key:
-            item["jira_2_key"] = record.jira_2_key
-        if record.last_sync_direction:
-            item["last_sync_direction"] = record.last_sync_direction.value
-        if record.jira_1_last_updated:
-            item["jira_1_last_updated"] = record.jira_1_last_updated.isoformat()
-        if record.jira_2_last_updated:
-            item["jira_2_last_updated"] = record.jira_2_last_updated.isoformat()
-        if record.last_error:
-            item["last_error"] = record.last_error
-        if record.conflict_details:
-            item["conflict_details"] = record.conflict_details
+        # Optional fields are only stored when set
+        for attr, encode in _OPTIONAL_RECORD_ATTRIBUTES:
+            value = getattr(record, attr)
+            if value:
+                item[attr] = encode(value)
+        if record.requires_manual_resolution:
+            # Key for the sparse conflicts-index; omitted so resolved records drop out of the index
+            item["needs_resolution"] = {"N": "1"}
 
         return item
 
     def _item_to_sync_record(self, item: dict[str, Any]) -> SyncRecord:
-        """Convert DynamoDB item to SyncRecord."""
-        return SyncRecord(
-            sync_id=item["sync_id"],
-            jira_1_key=item.get("jira_1_key"),
-            jira_2_key=item.get("jira_2_key"),
-            status=SyncStatus(item["status"]),
-            last_sync_direction=(SyncDirection(item["last_sync_direction"]) if "last_sync_direction" in item else None),
-            last_sync_timestamp=datetime.fromisoformat(item["last_sync_timestamp"]),
-            jira_1_last_updated=(
-                datetime.fromisoformat(item["jira_1_last_updated"]) if "jira_1_last_updated" in item else None
-            ),
-            jira_2_last_updated=(
-                datetime.fromisoformat(item["jira_2_last_updated"]) if "jira_2_last_updated" in item else None
-            ),
-            error_count=item.get("error_count", 0),
-            last_error=item.get("last_error"),
-            requires_manual_resolution=item.get("requires_manual_resolution", False),
-            conflict_details=item.get("conflict_details"),
+        """Convert a DynamoDB item (AttributeValue map) to SyncRecord.
+
+        Items are written by _sync_record_to_item, so validation is skipped; attributes missing from the
+        item (or left out of a projection) come back as the model defaults.
+        """
+        get = item.get
+        jira_1_key = get("jira_1_key")
+        jira_2_key = get("jira_2_key")
+        direction = get("last_sync_direction")
+        jira_1_updated = get("jira_1_last_updated")
+        jira_2_updated = get("jira_2_last_updated")
+        error_count = get("error_count")
+        last_error = get("last_error")
+        manual = get("requires_manual_resolution")
+        conflict_details = get("conflict_details")
+        version = get("version")
+        return SyncRecord.model_construct(
+            sync_id=item["sync_id"]["S"],
+            jira_1_key=jira_1_key["S"] if jira_1_key else None,
+            jira_2_key=jira_2_key["S"] if jira_2_key else None,
+            status=_STATUS_BY_VALUE[item["status"]["S"]],
+            last_sync_direction=_DIRECTION_BY_VALUE[direction["S"]] if direction else None,
+            last_sync_timestamp=_decode_timestamp(item["last_sync_timestamp"]),
+            jira_1_last_updated=_decode_timestamp(jira_1_updated) if jira_1_updated else None,
+            jira_2_last_updated=_decode_timestamp(jira_2_updated) if jira_2_updated else None,
+            error_count=int(error_count["N"]) if error_count else 0,
+            last_error=last_error["S"] if last_error else None,
+            requires_manual_resolution=manual["BOOL"] if manual else False,
+            conflict_details=conflict_details["S"] if conflict_details else None,
+            version=int(version["N"]) if version else 0,
         )
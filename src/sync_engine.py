@@ -1,12 +1,17 @@
 """Core sync engine for bidirectional JIRA synchronization."""
 
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import repeat
+from typing import Any
 
 import structlog
 
 from .config import SyncConfig
-from .jira_client import JiraAPIError, JiraClient
+from .jira_client import JiraAPIError, JiraClient, is_sync_comment_body
 from .models import (
     CommentSyncRecord,
     JiraComment,
@@ -16,10 +21,30 @@ from .models import (
     SyncResult,
     SyncStatus,
 )
-from .storage import DynamoDBStorage, StorageError
+from .storage import DynamoDBStorage, StorageConflictError, StorageError
 
 logger = structlog.get_logger()
 
+# Times a sync is restarted after another worker saved its record concurrently
+SYNC_CONFLICT_RETRIES = 3
+
+
+@dataclass(frozen=True, slots=True)
+class SyncContext:
+    """Everything that follows from which instance a sync starts on, built once per engine."""
+
+    source: int
+    target: int
+    source_client: JiraClient
+    target_client: JiraClient
+    direction: SyncDirection
+    source_name: str  # Attribution for comments copied from the source instance
+    # SyncRecord attributes holding each side's issue key and last seen update time
+    source_key_attr: str
+    target_key_attr: str
+    source_updated_attr: str
+    target_updated_attr: str
+
 
 class SyncEngine:
     """Main synchronization engine for bidirectional JIRA sync."""
@@ -27,22 +52,69 @@ class SyncEngine:
     def __init__(self, config: SyncConfig) -> None:
         """Initialize sync engine."""
         self.config = config
-        self.jira_1 = JiraClient(config.jira_instance_1, sync_assignee=config.sync_assignee)
-        self.jira_2 = JiraClient(config.jira_instance_2, sync_assignee=config.sync_assignee)
+        self.jira_1 = JiraClient(
+            config.jira_instance_1,
+            sync_assignee=config.sync_assignee,
+            cache_ttl_seconds=config.jira_cache_ttl_seconds,
+        )
+        self.jira_2 = JiraClient(
+            config.jira_instance_2,
+            sync_assignee=config.sync_assignee,
+            cache_ttl_seconds=config.jira_cache_ttl_seconds,
+        )
         self.storage = DynamoDBStorage(config.dynamodb)
+        # Indexed by source instance (1 or 2)
+        self._contexts = (
+            None,
+            SyncContext(
+                1,
+                2,
+                self.jira_1,
+                self.jira_2,
+                SyncDirection.JIRA_1_TO_2,
+                f"JIRA-1 ({config.jira_instance_1.base_url})",
+                "jira_1_key",
+                "jira_2_key",
+                "jira_1_last_updated",
+                "jira_2_last_updated",
+            ),
+            SyncContext(
+                2,
+                1,
+                self.jira_2,
+                self.jira_1,
+                SyncDirection.JIRA_2_TO_1,
+                f"JIRA-2 ({config.jira_instance_2.base_url})",
+                "jira_2_key",
+                "jira_1_key",
+                "jira_2_last_updated",
+                "jira_1_last_updated",
+            ),
+        )
 
     def initialize(self) -> None:
         """Initialize storage and ensure table exists."""
         logger.info("Initializing sync engine")
         self.storage.create_table_if_not_exists()
 
+    def warm_up(self) -> None:
+        """Open connections to both JIRA instances ahead of the first sync."""
+        self.jira_1.warm_up()
+        self.jira_2.warm_up()
+
     def sync_issue_from_webhook(
         self,
         issue_key: str,
         source_instance: int,  # 1 or 2
+        source_issue: JiraIssue | None = None,
     ) -> SyncResult:
-        """Sync a single issue triggered by webhook."""
-        logger.info(
+        """Sync a single issue triggered by webhook.
+
+        A ``source_issue`` already in hand (bulk-fetched, or carried by the webhook) saves the first attempt's
+        issue fetch; retries always refetch. One older than the last synced state is skipped as unchanged.
+        """
+        prefetched_issue = source_issue
+        logger.debug(
             "Starting webhook-triggered sync",
             issue_key=issue_key,
             source_instance=source_instance,
@@ -51,49 +123,77 @@ class SyncEngine:
         if source_instance not in (1, 2):
             raise ValueError("source_instance must be 1 or 2")
 
-        try:
-            # Get the source issue
-            source_client = self.jira_1 if source_instance == 1 else self.jira_2
-            source_issue = source_client.get_issue(issue_key)
-
-            # Find existing sync record
-            sync_record = self.storage.find_sync_record_by_jira_key(issue_key, source_instance)
+        attempt = 0
+        while True:
+            sync_record = None
+            try:
+                # The record lookup and the source issue fetch are independent; overlap the two round-trips
+                record_lookup = self.storage.prefetch_sync_record_by_jira_key(issue_key, source_instance)
+                if prefetched_issue is not None:
+                    source_issue, prefetched_issue = prefetched_issue, None
+                else:
+                    source_client = self._contexts[source_instance].source_client
+                    source_issue = source_client.get_issue(issue_key, use_cache=False)
+                sync_record = record_lookup.result()
 
-            if sync_record is None:
-                # New issue - create sync record and sync to other instance
-                return self._sync_new_issue(source_issue, source_instance)
-            else:
-                # Existing issue - update sync
-                return self._sync_existing_issue(source_issue, sync_record, source_instance)
+                if sync_record is None:
+                    # New issue - create sync record and sync to other instance
+                    return self._sync_new_issue(source_issue, source_instance)
+                else:
+                    # Existing issue - update sync
+                    return self._sync_existing_issue(source_issue, sync_record, source_instance)
+
+            except StorageConflictError as e:
+                # Another worker saved the record mid-sync; start over from fresh reads of the issue and
+                # record (JIRA writes already made are detected as no-ops on the next pass)
+                if attempt < SYNC_CONFLICT_RETRIES:
+                    delay = random.uniform(0, min(2.0, 0.1 * 2**attempt))  # noqa: S311
+                    attempt += 1
+                    logger.warning("Sync record changed concurrently, retrying", issue_key=issue_key, attempt=attempt)
+                    time.sleep(delay)
+                    continue
+
+                # Recording the failure would conflict too; the other writer's state stands
+                error_msg = f"Sync failed for {issue_key}: {e}"
+                logger.error("Sync failed", error=error_msg, issue_key=issue_key)
+                return SyncResult(
+                    success=False,
+                    sync_record=sync_record or self._create_error_sync_record(issue_key, source_instance),
+                    error_message=error_msg,
+                )
 
-        except (JiraAPIError, StorageError) as e:
-            error_msg = f"Sync failed for {issue_key}: {e}"
-            logger.error("Sync failed", error=error_msg, issue_key=issue_key)
-
-            # Try to update sync record with error
-            if sync_record:
-                sync_record.status = SyncStatus.FAILED
-                sync_record.error_count += 1
-                sync_record.last_error = error_msg
-                sync_record.last_sync_timestamp = datetime.now(UTC)
-                try:
-                    self.storage.save_sync_record(sync_record)
-                except StorageError:
-                    logger.error("Failed to save error state to storage")
+            except (JiraAPIError, StorageError) as e:
+                error_msg = f"Sync failed for {issue_key}: {e}"
+                logger.error("Sync failed", error=error_msg, issue_key=issue_key)
+
+                # Try to update sync record with error
+                if sync_record:
+                    sync_record.status = SyncStatus.FAILED
+                    sync_record.error_count += 1
+                    sync_record.last_error = error_msg
+                    sync_record.last_sync_timestamp = datetime.now(UTC)
+                    try:
+                        self.storage.save_sync_record(sync_record)
+                    except StorageError:
+                        logger.error("Failed to save error state to storage")
+
+                return SyncResult(
+                    success=False,
+                    sync_record=sync_record or self._create_error_sync_record(issue_key, source_instance),
+                    error_message=error_msg,
+                )
 
-            return SyncResult(
-                success=False,
-                sync_record=sync_record or self._create_error_sync_record(issue_key, source_instance),
-                error_message=error_msg,
-            )
+    def issue_from_webhook(self, issue_data: dict[str, Any], source_instance: int) -> JiraIssue | None:
+        """Parse a webhook's issue payload with the source instance's client (None if unusable)."""
+        return self._contexts[source_instance].source_client.parse_webhook_issue(issue_data)
 
     def _sync_new_issue(self, source_issue: JiraIssue, source_instance: int) -> SyncResult:
         """Sync a new issue to the target instance."""
-        target_instance = 2 if source_instance == 1 else 1
-        target_client = self.jira_2 if source_instance == 1 else self.jira_1
-        direction = SyncDirection.JIRA_1_TO_2 if source_instance == 1 else SyncDirection.JIRA_2_TO_1
+        ctx = self._contexts[source_instance]
+        target_client = ctx.target_client
+        direction = ctx.direction
 
-        logger.info(
+        logger.debug(
             "Syncing new issue",
             source_key=source_issue.key,
             direction=direction,
@@ -107,15 +207,12 @@ class SyncEngine:
             last_sync_timestamp=datetime.now(UTC),
         )
 
-        if source_instance == 1:
-            sync_record.jira_1_key = source_issue.key
-            sync_record.jira_1_last_updated = source_issue.updated
-        else:
-            sync_record.jira_2_key = source_issue.key
-            sync_record.jira_2_last_updated = source_issue.updated
+        setattr(sync_record, ctx.source_key_attr, source_issue.key)
+        setattr(sync_record, ctx.source_updated_attr, source_issue.updated)
 
-        # Save initial record
-        self.storage.save_sync_record(sync_record)
+        # Save initial record; if a concurrent sync of the same issue created it first, the conflict makes
+        # the webhook sync retry, which then finds the record and updates instead of creating a duplicate
+        self.storage.save_sync_record(sync_record, create=True)
 
         try:
             # Create issue in target instance
@@ -123,12 +220,8 @@ class SyncEngine:
             target_issue = target_client.create_issue(create_payload)
 
             # Update sync record with target key
-            if target_instance == 1:
-                sync_record.jira_1_key = target_issue.key
-                sync_record.jira_1_last_updated = target_issue.updated
-            else:
-                sync_record.jira_2_key = target_issue.key
-                sync_record.jira_2_last_updated = target_issue.updated
+            setattr(sync_record, ctx.target_key_attr, target_issue.key)
+            setattr(sync_record, ctx.target_updated_attr, target_issue.updated)
 
             sync_record.status = SyncStatus.SUCCESS
             sync_record.last_sync_direction = direction
@@ -161,11 +254,11 @@ class SyncEngine:
         source_instance: int,
     ) -> SyncResult:
         """Sync updates to an existing issue."""
-        target_instance = 2 if source_instance == 1 else 1
-        target_client = self.jira_2 if source_instance == 1 else self.jira_1
-        direction = SyncDirection.JIRA_1_TO_2 if source_instance == 1 else SyncDirection.JIRA_2_TO_1
+        ctx = self._contexts[source_instance]
+        target_client = ctx.target_client
+        direction = ctx.direction
 
-        target_key = sync_record.jira_2_key if source_instance == 1 else sync_record.jira_1_key
+        target_key = getattr(sync_record, ctx.target_key_attr)
 
         if not target_key:
             logger.error("Target key not found in sync record", sync_id=sync_record.sync_id)
@@ -175,26 +268,31 @@ class SyncEngine:
                 error_message="Target issue key not found in sync record",
             )
 
-        logger.info(
+        logger.debug(
             "Syncing existing issue update",
             source_key=source_issue.key,
             target_key=target_key,
             direction=direction,
         )
 
+        # Nothing changed on the source since it was last synced successfully (typically the webhook echoing
+        # our own write to it), so the target already matches; skip the target fetch and the record writes
+        if self._is_unchanged_since_sync(sync_record, source_instance, source_issue.updated):
+            logger.debug("Source unchanged since last sync, skipping", source_key=source_issue.key)
+            return SyncResult(success=True, sync_record=sync_record)
+
         # Check for conflicts
-        conflict_result = self._check_for_conflicts(source_issue, sync_record, source_instance)
+        conflict_result, fetched_target = self._check_for_conflicts(source_issue, sync_record, source_instance)
         if conflict_result.conflicts_detected:
             return conflict_result
 
-        # Update sync record status
-        sync_record.status = SyncStatus.IN_PROGRESS
+        # Only the outcome is persisted; the versioned save at the end detects a concurrent sync
         sync_record.last_sync_timestamp = datetime.now(UTC)
-        self.storage.save_sync_record(sync_record)
 
         try:
             # Get current target issue
-            target_issue = target_client.get_issue(target_key)
+            # Reuse the issue the conflict check just read, whatever the client's cache settings
+            target_issue = fetched_target or target_client.get_issue(target_key)
 
             # Check if any changes are needed (including status)
             update_payload = target_client.convert_to_update_payload(target_issue, source_issue)
@@ -202,7 +300,7 @@ class SyncEngine:
 
             if not update_payload.get("fields") and not status_changed:
                 # No changes needed
-                logger.info("No changes detected, skipping update", target_key=target_key)
+                logger.debug("No changes detected, skipping update", target_key=target_key)
                 sync_record.status = SyncStatus.SUCCESS
             else:
                 # Apply updates including status transitions (if configured)
@@ -211,13 +309,9 @@ class SyncEngine:
                 else:
                     # Only update fields, skip status
                     updated_target = target_client.update_issue(target_key, update_payload)
-                    updated_target = target_client.get_issue(target_key)
 
                 # Update sync record
-                if target_instance == 1:
-                    sync_record.jira_1_last_updated = updated_target.updated
-                else:
-                    sync_record.jira_2_last_updated = updated_target.updated
+                setattr(sync_record, ctx.target_updated_attr, updated_target.updated)
 
                 sync_record.status = SyncStatus.SUCCESS
 
@@ -233,10 +327,7 @@ class SyncEngine:
                     updated_fields=updated_fields,
                 )
 
-            if source_instance == 1:
-                sync_record.jira_1_last_updated = source_issue.updated
-            else:
-                sync_record.jira_2_last_updated = source_issue.updated
+            setattr(sync_record, ctx.source_updated_attr, source_issue.updated)
 
             sync_record.last_sync_direction = direction
             sync_record.error_count = 0  # Reset error count on success
@@ -261,41 +352,51 @@ class SyncEngine:
                 error_message=str(e),
             )
 
+    def _is_unchanged_since_sync(self, sync_record: SyncRecord, source_instance: int, updated: datetime) -> bool:
+        """Whether the source issue was last synced successfully and has not been updated since."""
+        last_known = getattr(sync_record, self._contexts[source_instance].source_updated_attr)
+        return sync_record.status == SyncStatus.SUCCESS and last_known is not None and updated <= last_known
+
     def _check_for_conflicts(
         self,
         source_issue: JiraIssue,
         sync_record: SyncRecord,
         source_instance: int,
-    ) -> SyncResult:
-        """Check for conflicts in bidirectional sync."""
-        # target_instance = 2 if source_instance == 1 else 1
-        target_client = self.jira_2 if source_instance == 1 else self.jira_1
-        target_key = sync_record.jira_2_key if source_instance == 1 else sync_record.jira_1_key
+    ) -> tuple[SyncResult, JiraIssue | None]:
+        """Check for conflicts in bidirectional sync.
 
-        if not target_key:
-            # No target issue yet, no conflict possible
+        Also returns the freshly fetched target issue (None if there is none), for the update to reuse.
+        """
+        ctx = self._contexts[source_instance]
+        target_client = ctx.target_client
+        target_key = getattr(sync_record, ctx.target_key_attr)
+
+        # Get last known update timestamps
+        source_last_known = getattr(sync_record, ctx.source_updated_attr)
+        target_last_known = getattr(sync_record, ctx.target_updated_attr)
+        source_updated_since_sync = source_last_known is None or source_issue.updated > source_last_known
+
+        if not target_key or not source_updated_since_sync:
+            # No target issue yet, or the source has not changed since the last sync: no conflict possible,
+            # so the target need not be read here
             return SyncResult(
                 success=True,
                 sync_record=sync_record,
                 conflicts_detected=False,
-            )
+            ), None
 
         try:
-            target_issue = target_client.get_issue(target_key)
+            # Always read fresh for conflict detection
+            target_issue = target_client.get_issue(target_key, use_cache=False)
         except JiraAPIError:
             # Target issue doesn't exist, no conflict
             return SyncResult(
                 success=True,
                 sync_record=sync_record,
                 conflicts_detected=False,
-            )
+            ), None
 
-        # Get last known update timestamps
-        source_last_known = sync_record.jira_1_last_updated if source_instance == 1 else sync_record.jira_2_last_updated
-        target_last_known = sync_record.jira_2_last_updated if source_instance == 1 else sync_record.jira_1_last_updated
-
-        # Check if both issues were updated since last sync
-        source_updated_since_sync = source_last_known is None or source_issue.updated > source_last_known
+        # Check if the target was also updated since last sync
         target_updated_since_sync = target_last_known is None or target_issue.updated > target_last_known
 
         if source_updated_since_sync and target_updated_since_sync:
@@ -329,13 +430,13 @@ class SyncEngine:
                 sync_record=sync_record,
                 error_message=conflict_details,
                 conflicts_detected=True,
-            )
+            ), target_issue
 
         return SyncResult(
             success=True,
             sync_record=sync_record,
             conflicts_detected=False,
-        )
+        ), target_issue
 
     def resolve_conflict_manual(
         self,
@@ -368,8 +469,8 @@ class SyncEngine:
             raise ValueError("Source key not found in sync record")
 
         # Get source issue and perform sync
-        source_client = self.jira_1 if source_instance == 1 else self.jira_2
-        source_issue = source_client.get_issue(source_key)
+        source_client = self._contexts[source_instance].source_client
+        source_issue = source_client.get_issue(source_key, use_cache=False)
 
         # Reset conflict state
         sync_record.status = SyncStatus.PENDING
@@ -384,48 +485,85 @@ class SyncEngine:
         logger.info("Starting full sync")
         results = []
 
-        # Get all issues from both instances
-        # Note: In practice, you might want to limit this with date filters
-        jira_1_issues = self.jira_1.search_issues(
-            f'project = "{self.config.jira_instance_1.project_key}"',
-            max_results=1000,
-        )
-        jira_2_issues = self.jira_2.search_issues(
-            f'project = "{self.config.jira_instance_2.project_key}"',
-            max_results=1000,
-        )
-
-        # Process JIRA 1 issues
-        for issue in jira_1_issues:
-            try:
-                result = self.sync_issue_from_webhook(issue.key, 1)
-                results.append(result)
-                time.sleep(0.1)  # Rate limiting
-            except Exception as e:
-                logger.error("Error in full sync", issue_key=issue.key, error=str(e))
-
-        # Process JIRA 2 issues
-        for issue in jira_2_issues:
-            try:
-                # Check if this issue is already synced
-                existing_record = self.storage.find_sync_record_by_jira_key(issue.key, 2)
-                if not existing_record:
-                    result = self.sync_issue_from_webhook(issue.key, 2)
-                    results.append(result)
-                time.sleep(0.1)  # Rate limiting
-            except Exception as e:
-                logger.error("Error in full sync", issue_key=issue.key, error=str(e))
+        # Issue keys are streamed page by page and each sync is submitted as its key arrives, so work
+        # starts after the first page; each sync fetches its own issue, if it changed. Each JIRA client's shared token
+        # bucket paces the concurrent requests.
+        with ThreadPoolExecutor(max_workers=self.config.full_sync_workers, thread_name_prefix="full-sync") as pool:
+            # The JIRA 2 listing is only (key, updated) pairs; fetch it in the background during the JIRA 1 pass
+            jira_2_listing = pool.submit(
+                lambda: list(
+                    self.jira_2.iter_issue_updates(
+                        f'project = "{self.config.jira_instance_2.project_key}"',
+                        max_results=1000,
+                    )
+                )
+            )
 
+            # Note: In practice, you might want to limit this with date filters
+            jira_1_issues = self.jira_1.iter_issue_updates(
+                f'project = "{self.config.jira_instance_1.project_key}"',
+                max_results=1000,
+            )
+            results.extend(pool.map(self._full_sync_issue, jira_1_issues, repeat(1)))
+
+            # JIRA 2 issues only need syncing if nothing links them yet. Read every linked key in one
+            # projected scan (after the JIRA 1 pass, which creates links) rather than one query per issue.
+            linked_jira_2_keys = {
+                record.jira_2_key
+                for record in self.storage.get_all_sync_records(attributes=["jira_2_key"])
+                if record.jira_2_key
+            }
+            jira_2_issues = (issue for issue in jira_2_listing.result() if issue[0] not in linked_jira_2_keys)
+            results.extend(pool.map(self._full_sync_issue, jira_2_issues, repeat(2)))
+
+        results = [result for result in results if result is not None]
         logger.info("Full sync completed", total_results=len(results))
         return results
 
+    def _full_sync_issue(self, issue: tuple[str, datetime], source_instance: int) -> SyncResult | None:
+        """Sync one (key, updated) issue for a full sync; errors are logged so one failure does not stop the rest.
+
+        Issues not updated since their last successful sync are skipped before fetching them from JIRA.
+        """
+        issue_key, updated = issue
+        try:
+            sync_record = self.storage.find_sync_record_by_jira_key(issue_key, source_instance)
+            if sync_record is not None and self._is_unchanged_since_sync(sync_record, source_instance, updated):
+                return SyncResult(success=True, sync_record=sync_record)
+
+            # The record lookup above is served from the storage cache when the sync repeats it
+            return self.sync_issue_from_webhook(issue_key, source_instance)
+        except Exception as e:
+            logger.error("Error in full sync", issue_key=issue_key, error=str(e))
+            return None
+
+    def _retry_sync(
+        self, sync_id: str, source_instance: int, source_key: str, source_issues: dict[int, dict[str, JiraIssue]]
+    ) -> SyncResult | None:
+        """Retry one failed sync, using its bulk-fetched source issue if there is one; errors are logged."""
+        try:
+            return self.sync_issue_from_webhook(
+                source_key, source_instance, source_issues[source_instance].get(source_key)
+            )
+        except Exception as e:
+            logger.error(
+                "Error during retry",
+                sync_id=sync_id,
+                error=str(e),
+            )
+            return None
+
     def retry_failed_syncs(self) -> list[SyncResult]:
         """Retry all failed sync operations."""
         logger.info("Retrying failed syncs")
 
-        failed_records = self.storage.get_records_by_status(SyncStatus.FAILED)
-        results = []
-
+        # Only what is needed to pick the retry direction; the sync itself re-reads the full record
+        failed_records = self.storage.get_records_by_status(
+            SyncStatus.FAILED,
+            attributes=["jira_1_key", "jira_2_key", "last_sync_direction", "error_count"],
+        )
+        # Pick each record's retry direction first so the source issues can be fetched in bulk
+        retries: list[tuple[str, int, str]] = []
         for record in failed_records:
             if record.error_count >= self.config.max_retries:
                 logger.warning(
@@ -435,39 +573,41 @@ class SyncEngine:
                 )
                 continue
 
-            try:
-                # Determine which issue to retry
-                if record.last_sync_direction == SyncDirection.JIRA_1_TO_2:
-                    source_instance = 1
-                    source_key = record.jira_1_key
-                elif record.last_sync_direction == SyncDirection.JIRA_2_TO_1:
-                    source_instance = 2
-                    source_key = record.jira_2_key
-                else:
-                    # Try both directions if unclear
-                    if record.jira_1_key:
-                        source_instance = 1
-                        source_key = record.jira_1_key
-                    elif record.jira_2_key:
-                        source_instance = 2
-                        source_key = record.jira_2_key
-                    else:
-                        logger.error("No source key found for retry", sync_id=record.sync_id)
-                        continue
-
-                if source_key:
-                    result = self.sync_issue_from_webhook(source_key, source_instance)
-                    results.append(result)
-
-                    # Add delay between retries
-                    time.sleep(self.config.retry_delay_seconds)
-
-            except Exception as e:
-                logger.error(
-                    "Error during retry",
-                    sync_id=record.sync_id,
-                    error=str(e),
-                )
+            # Determine which issue to retry
+            if record.last_sync_direction == SyncDirection.JIRA_1_TO_2:
+                source_instance, source_key = 1, record.jira_1_key
+            elif record.last_sync_direction == SyncDirection.JIRA_2_TO_1:
+                source_instance, source_key = 2, record.jira_2_key
+            # Try both directions if unclear
+            elif record.jira_1_key:
+                source_instance, source_key = 1, record.jira_1_key
+            elif record.jira_2_key:
+                source_instance, source_key = 2, record.jira_2_key
+            else:
+                logger.error("No source key found for retry", sync_id=record.sync_id)
+                continue
+
+            if source_key:
+                retries.append((record.sync_id, source_instance, source_key))
+
+        # One JQL search per batch of keys instead of an issue GET per retry; issues it misses (or a failed
+        # search) fall back to the sync's own fetch
+        source_issues: dict[int, dict[str, JiraIssue]] = {1: {}, 2: {}}
+        for source_instance, issues in source_issues.items():
+            keys = [source_key for _, instance, source_key in retries if instance == source_instance]
+            if keys:
+                try:
+                    issues.update(self._contexts[source_instance].source_client.search_issues_by_keys(keys))
+                except JiraAPIError as e:
+                    logger.warning("Bulk fetch of retried issues failed", source_instance=source_instance, error=str(e))
+
+        # Retries run concurrently like a full sync; the JIRA clients pace requests to the server's limits
+        with ThreadPoolExecutor(max_workers=self.config.full_sync_workers, thread_name_prefix="retry-sync") as pool:
+            results = [
+                result
+                for result in pool.map(lambda retry: self._retry_sync(*retry, source_issues), retries)
+                if result is not None
+            ]
 
         logger.info("Retry completed", retry_count=len(results))
         return results
@@ -492,10 +632,7 @@ class SyncEngine:
             error_count=1,
         )
 
-        if source_instance == 1:
-            record.jira_1_key = issue_key
-        else:
-            record.jira_2_key = issue_key
+        setattr(record, self._contexts[source_instance].source_key_attr, issue_key)
 
         return record
 
@@ -505,14 +642,24 @@ class SyncEngine:
         comment_id: str,
         source_instance: int,
         event_type: str = "created",  # created, updated, deleted
+        comment_body: str | None = None,
     ) -> bool:
-        """Sync a comment triggered by webhook."""
+        """Sync a comment triggered by webhook.
+
+        ``comment_body`` is the comment text when the webhook carried it; a comment written by the sync
+        system is then skipped without any storage or JIRA calls.
+        """
         # Check if comment sync is enabled
         if not self.config.sync_comments:
             logger.info("Comment sync disabled, skipping", comment_id=comment_id)
             return True
 
-        logger.info(
+        # Skip echoes of our own sync comments before any I/O to prevent loops
+        if comment_body is not None and is_sync_comment_body(comment_body):
+            logger.debug("Skipping sync comment to prevent loop", comment_id=comment_id)
+            return True
+
+        logger.debug(
             "Starting comment sync",
             issue_key=issue_key,
             comment_id=comment_id,
@@ -523,10 +670,14 @@ class SyncEngine:
         if source_instance not in (1, 2):
             raise ValueError("source_instance must be 1 or 2")
 
+        # Set once a new comment's sync is claimed, and once it has been copied and recorded
+        claim_id: str | None = None
+        copied = False
         try:
-            source_client = self.jira_1 if source_instance == 1 else self.jira_2
-            target_client = self.jira_2 if source_instance == 1 else self.jira_1
-            target_instance = 2 if source_instance == 1 else 1
+            ctx = self._contexts[source_instance]
+            source_client = ctx.source_client
+            target_client = ctx.target_client
+            target_instance = ctx.target
 
             # Get source issue with target key for sync
             source_sync_record = self.storage.find_sync_record_by_jira_key(issue_key, source_instance)
@@ -534,17 +685,31 @@ class SyncEngine:
                 logger.warning("No sync record found for issue, skipping comment sync", issue_key=issue_key)
                 return False
 
-            target_issue_key = source_sync_record.jira_2_key if source_instance == 1 else source_sync_record.jira_1_key
+            target_issue_key = getattr(source_sync_record, ctx.target_key_attr)
 
             if not target_issue_key:
                 logger.warning("No target issue key found, skipping comment sync", issue_key=issue_key)
                 return False
 
-            # Check if this comment was already synced to prevent loops
-            existing_comment_sync = self.storage.find_comment_sync_by_source(issue_key, comment_id, target_instance)
-
-            if existing_comment_sync:
-                logger.info("Comment already synced, skipping", comment_id=comment_id)
+            # Check if this comment was already synced to prevent loops. A new comment is claimed with one
+            # conditional write instead, so concurrent deliveries of the same event cannot both copy it.
+            if event_type == "created":
+                claim = CommentSyncRecord(
+                    sync_id=self.storage._generate_comment_sync_id(issue_key, comment_id, target_instance),
+                    issue_key=issue_key,
+                    source_comment_id=comment_id,
+                    source_instance=source_instance,
+                    target_instance=target_instance,
+                    last_sync_timestamp=datetime.now(UTC),
+                    sync_direction=self._contexts[source_instance].direction,
+                    status=SyncStatus.IN_PROGRESS,
+                )
+                if not self.storage.claim_comment_sync(claim):
+                    logger.debug("Comment already synced, skipping", comment_id=comment_id)
+                    return True
+                claim_id = claim.sync_id
+            elif self.storage.find_comment_sync_by_source(issue_key, comment_id, target_instance):
+                logger.debug("Comment already synced, skipping", comment_id=comment_id)
                 return True
 
             if event_type == "deleted":
@@ -568,18 +733,15 @@ class SyncEngine:
 
             # Skip sync comments to prevent infinite loops
             if source_comment.is_sync_comment:
-                logger.info("Skipping sync comment to prevent loop", comment_id=comment_id)
+                logger.debug("Skipping sync comment to prevent loop", comment_id=comment_id)
                 return True
 
             # Determine source instance name for attribution
-            source_instance_name = (
-                f"JIRA-1 ({self.config.jira_instance_1.base_url})"
-                if source_instance == 1
-                else f"JIRA-2 ({self.config.jira_instance_2.base_url})"
-            )
+            source_instance_name = self._contexts[source_instance].source_name
 
             if event_type == "created":
-                return self._sync_new_comment(
+                # On success the claim is overwritten by the completed comment sync record
+                copied = self._sync_new_comment(
                     source_comment,
                     issue_key,
                     target_issue_key,
@@ -588,6 +750,7 @@ class SyncEngine:
                     target_client,
                     source_instance_name,
                 )
+                return copied
             elif event_type == "updated":
                 return self._sync_updated_comment(
                     source_comment,
@@ -606,6 +769,14 @@ class SyncEngine:
             logger.error("Comment sync failed", error=str(e), comment_id=comment_id)
             return False
 
+        finally:
+            if claim_id and not copied:
+                # Nothing was copied (skipped or failed); release the claim so a redelivery can retry
+                try:
+                    self.storage.delete_comment_sync_record(claim_id)
+                except StorageError:
+                    logger.error("Failed to release comment sync claim", sync_id=claim_id)
+
     def _sync_new_comment(
         self,
         source_comment: JiraComment,
@@ -622,7 +793,7 @@ class SyncEngine:
             target_comment = target_client.create_sync_comment(target_issue_key, source_comment, source_instance_name)
 
             # Create comment sync record
-            direction = SyncDirection.JIRA_1_TO_2 if source_instance == 1 else SyncDirection.JIRA_2_TO_1
+            direction = self._contexts[source_instance].direction
             comment_sync_record = CommentSyncRecord(
                 sync_id=self.storage._generate_comment_sync_id(source_issue_key, source_comment.id, target_instance),
                 issue_key=source_issue_key,
@@ -681,15 +852,8 @@ class SyncEngine:
                 )
 
             # Update the target comment
-            updated_body = (
-                f"[JIRA-SYNC] Original author: {source_comment.author_name}"
-                f"{f' ({source_comment.author_email})' if source_comment.author_email else ''}\n"
-                f"[JIRA-SYNC] Source ID: {source_comment.id}\n"
-                f"[JIRA-SYNC] From: {source_instance_name}\n"
-                f"[JIRA-SYNC] Created: {source_comment.created.strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
-                f"[JIRA-SYNC] Updated: {source_comment.updated.strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
-                f"---\n\n"
-                f"{source_comment.body}"
+            updated_body = target_client.format_sync_comment_body(
+                source_comment, source_instance_name, include_updated=True
             )
 
             target_client.update_comment(target_issue_key, comment_sync.target_comment_id, updated_body)
@@ -721,7 +885,7 @@ class SyncEngine:
     ) -> bool:
         """Handle comment deletion by deleting the corresponding synced comment."""
         try:
-            target_instance = 2 if source_instance == 1 else 1
+            target_instance = self._contexts[source_instance].target
 
             # Find the synced comment
             comment_sync = self.storage.find_comment_sync_by_source(